@@ -298,6 +298,27 @@ def check_session_access(session_id: str, user: TokenData):
         raise HTTPException(status_code=403, detail="Access denied to this session")
 
 
+def check_sessions_access(session_ids: list[str], user: TokenData):
+    """Bulk variant of check_session_access: one owner query for all ids.
+
+    Same per-session rules, but endpoints validating a whole membership list
+    pay one SELECT ... IN (...) instead of a round-trip per session."""
+    if user.role == "admin" and not is_asg_launch_mode():
+        return
+    if not session_ids:
+        return
+    from app.db import get_session_owners
+    owners = get_session_owners(session_ids)
+    for session_id in session_ids:
+        owner = owners.get(session_id)
+        if owner is None:
+            if is_asg_launch_mode():
+                raise HTTPException(status_code=403, detail="Access denied to this session")
+            continue
+        if owner != user.user_id:
+            raise HTTPException(status_code=403, detail="Access denied to this session")
+
+
 def check_project_access(project_id: str, user: TokenData):
     """Raise 403 if user doesn't own the project (admin bypasses)."""
     if user.role == "admin" and not is_asg_launch_mode():
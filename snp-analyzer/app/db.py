@@ -16,9 +16,19 @@ def get_db() -> sqlite3.Connection:
     global _conn
     if _conn is None:
         DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        _conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+        # cached_statements: keep more prepared statements alive (default 128)
+        # so hot SQL skips the parse/plan step on repeat execution
+        _conn = sqlite3.connect(
+            str(DB_PATH), check_same_thread=False, cached_statements=256
+        )
         _conn.execute("PRAGMA journal_mode=WAL")
         _conn.execute("PRAGMA foreign_keys=ON")
+        # WAL makes synchronous=NORMAL safe (no torn pages on power loss, at
+        # most the last transaction is lost) and drops an fsync per commit.
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        _conn.execute("PRAGMA temp_store=MEMORY")
+        _conn.execute("PRAGMA busy_timeout=5000")
         _conn.row_factory = sqlite3.Row
     return _conn
 
@@ -139,6 +149,21 @@ def _run_migrations(conn: sqlite3.Connection):
             conn.execute("ALTER TABLE marker_regions ADD COLUMN catalog_id TEXT")
         conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (6)")
 
+    if current < 7:
+        # Migration 7: indexes for the project hot paths. list_projects
+        # filters by user_id and orders by created_at on every dashboard
+        # load, and _get_session_ids orders memberships by position; without
+        # these SQLite re-sorts per request.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_projects_user_created "
+            "ON projects(user_id, created_at DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_project_sessions_project_position "
+            "ON project_sessions(project_id, position)"
+        )
+        conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (7)")
+
     conn.commit()
 
 
@@ -250,6 +275,30 @@ def save_welltype(session_id: str, well: str, welltype: str):
     conn.commit()
 
 
+def save_welltypes_bulk(session_id: str, mapping: dict[str, str]):
+    """Write many manual welltype overrides in one transaction.
+
+    One prepared statement via executemany and a single commit/fsync, instead
+    of a round-trip per well on bulk edits."""
+    conn = get_db()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO manual_welltypes (session_id, well, welltype) VALUES (?, ?, ?)",
+            [(session_id, well, welltype) for well, welltype in mapping.items()],
+        )
+
+
+def replace_welltypes(session_id: str, mapping: dict[str, str]):
+    """Replace a session's full manual welltype snapshot atomically."""
+    conn = get_db()
+    with conn:
+        conn.execute("DELETE FROM manual_welltypes WHERE session_id = ?", (session_id,))
+        conn.executemany(
+            "INSERT INTO manual_welltypes (session_id, well, welltype) VALUES (?, ?, ?)",
+            [(session_id, well, welltype) for well, welltype in mapping.items()],
+        )
+
+
 def delete_welltypes(session_id: str):
     """Delete all manual welltypes for a session."""
     conn = get_db()
@@ -267,6 +316,19 @@ def save_sample_override(session_id: str, well: str, name: str):
     conn.commit()
 
 
+def save_sample_overrides_bulk(session_id: str, mapping: dict[str, str]):
+    """Write many sample name overrides in one transaction.
+
+    One prepared statement via executemany and a single commit/fsync, instead
+    of a round-trip per well on bulk edits."""
+    conn = get_db()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sample_name_overrides (session_id, well, sample_name) VALUES (?, ?, ?)",
+            [(session_id, well, name) for well, name in mapping.items()],
+        )
+
+
 def delete_sample_overrides(session_id: str):
     """Delete all sample name overrides for a session."""
     conn = get_db()
@@ -291,6 +353,19 @@ def get_session_owner(session_id: str) -> str | None:
     return row["user_id"] if row else None
 
 
+def get_session_owners(session_ids: list[str]) -> dict[str, str | None]:
+    """Owner user_ids for many sessions in one query. Unknown ids are absent."""
+    if not session_ids:
+        return {}
+    conn = get_db()
+    placeholders = ",".join("?" * len(session_ids))
+    rows = conn.execute(
+        f"SELECT session_id, user_id FROM sessions WHERE session_id IN ({placeholders})",
+        session_ids,
+    ).fetchall()
+    return {r["session_id"]: r["user_id"] for r in rows}
+
+
 def save_well_groups(session_id: str, groups: dict[str, list[str]]):
     """Write manual well groups to DB."""
     conn = get_db()
@@ -1,7 +1,8 @@
 from __future__ import annotations
+from dataclasses import dataclass
 from enum import Enum
 from typing import Literal
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class WellCycleData(BaseModel):
@@ -13,7 +14,12 @@ class WellCycleData(BaseModel):
     normalization_value: float | None = None
 
 
-class NormalizedPoint(BaseModel):
+# Internal hot-path record (N wells x C cycles instances per normalization
+# pass), consumed by attribute access and never serialized as a model — a
+# slotted frozen dataclass, not a BaseModel, so each instance skips the
+# __dict__ and pydantic construction overhead.
+@dataclass(slots=True, frozen=True)
+class NormalizedPoint:
     well: str
     cycle: int
     norm_fam: float
@@ -46,6 +52,46 @@ class UnifiedData(BaseModel):
     role_channels: dict[str, str] | None = None
     ploidy: int = 2                  # allele copies per locus (2=diploid .. 8)
 
+    # Memoized normalize() results, keyed by use_rox. Report generation runs
+    # Ct calculation and quality scoring back to back over the same readings;
+    # caching here removes the duplicated full-plate normalization pass.
+    _norm_cache: dict = PrivateAttr(default_factory=dict)
+
+    # Memoized well -> (row, col) plate coordinates; parsed once instead of
+    # re-running ord()/int() over every well on each plate/PDF request.
+    _well_index: dict = PrivateAttr(default_factory=dict)
+
+    # Memoized compute_suggested_cycle result, wrapped in a one-element tuple
+    # because None is a valid suggestion. The readings never change after
+    # parsing, so the scan only needs to run once per session.
+    _suggested_cycle: tuple | None = PrivateAttr(default=None)
+
+    def get_well_index(self) -> dict[str, tuple[int, int]]:
+        """Map each well ID to zero-based (row, col) plate coordinates."""
+        if not self._well_index:
+            self._well_index = {
+                w: (ord(w[0]) - ord("A"), int(w[1:]) - 1) for w in self.wells
+            }
+        return self._well_index
+
+    def get_normalized(self, use_rox: bool = True) -> list[NormalizedPoint]:
+        """normalize(self, use_rox=...) with memoization on this instance.
+
+        The cached entry records the identity of ``self.data`` so a
+        ``model_copy(update={"data": ...})`` clone (which shares the private
+        cache dict) can never serve stale points for a different data list.
+        """
+        key = bool(use_rox)
+        cached = self._norm_cache.get(key)
+        if cached is not None and cached[0] is self.data:
+            return cached[1]
+
+        from app.processing.normalize import normalize
+
+        result = normalize(self, use_rox=use_rox)
+        self._norm_cache[key] = (self.data, result)
+        return result
+
 
 class UploadResponse(BaseModel):
     session_id: str
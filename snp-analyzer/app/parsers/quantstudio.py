@@ -9,35 +9,57 @@ File structure:
 - Empty wells have '' (empty string) for dye values
 """
 
-import xlrd
+from python_calamine import CalamineWorkbook
 
 from app.models import UnifiedData, WellCycleData, DataWindow
 
 WELL_ROWS = "ABCDEFGH"
 
+# Precomputed A1-H12 ids, indexed by 0-based row-major plate index, so the hot
+# per-row conversion below is a tuple lookup instead of an f-string build.
+_WELL_IDS = tuple(f"{WELL_ROWS[i // 12]}{i % 12 + 1}" for i in range(96))
+
+# Plate-order rank per well id: sorting 96 known ids by one dict lookup beats
+# re-parsing row letter + column int on every comparison.
+_WELL_ORDER = {wid: i for i, wid in enumerate(_WELL_IDS)}
+
 
 def well_num_to_id(n: int) -> str:
     """Convert 1-based well number to A1-H12 format (row-major order)."""
-    row = (n - 1) // 12
-    col = (n - 1) % 12 + 1
-    return f"{WELL_ROWS[row]}{col}"
+    return _WELL_IDS[n - 1]
+
 
+def _load_rows(file_path: str) -> list[list]:
+    """Load the first sheet as a list of rows (Rust-backed calamine reader).
+
+    Rows may be ragged: calamine trims trailing empty cells, so callers index
+    through _cell() rather than assuming rectangular data.
+    """
+    wb = CalamineWorkbook.from_path(file_path)
+    return wb.get_sheet_by_index(0).to_python()
 
-def find_header_row(sheet: xlrd.sheet.Sheet) -> int:
+
+def _cell(row: list, c: int):
+    """Cell value with xlrd-style '' for cells beyond the stored row width."""
+    return row[c] if c < len(row) else ""
+
+
+def find_header_row(rows: list[list]) -> int:
     """Find the header row by looking for 'Well' in column A."""
-    for r in range(min(60, sheet.nrows)):
-        val = sheet.cell_value(r, 0)
-        if isinstance(val, str) and val.strip().lower() == "well":
-            return r
-    raise ValueError("Could not find header row with 'Well' in column A")
+    try:
+        return next(
+            r for r, row in enumerate(rows[:60])
+            if row and isinstance(row[0], str) and row[0].strip().lower() == "well"
+        )
+    except StopIteration:
+        raise ValueError("Could not find header row with 'Well' in column A") from None
 
 
 def parse_quantstudio(file_path: str) -> UnifiedData:
-    wb = xlrd.open_workbook(file_path)
-    sheet = wb.sheet_by_index(0)
+    rows = _load_rows(file_path)
 
-    header_row = find_header_row(sheet)
-    headers = [sheet.cell_value(header_row, c).strip() for c in range(sheet.ncols)]
+    header_row = find_header_row(rows)
+    headers = [str(h).strip() for h in rows[header_row]]
 
     # Dynamically detect column indices
     col_map = {}
@@ -70,10 +92,9 @@ def parse_quantstudio(file_path: str) -> UnifiedData:
     wells_set: set[str] = set()
     cycles_set: set[int] = set()
 
-    data_start = header_row + 1
-    for r in range(data_start, sheet.nrows):
-        well_num = sheet.cell_value(r, well_col)
-        cycle_val = sheet.cell_value(r, cycle_col)
+    for row in rows[header_row + 1:]:
+        well_num = _cell(row, well_col)
+        cycle_val = _cell(row, cycle_col)
 
         if not isinstance(well_num, (int, float)) or not isinstance(
             cycle_val, (int, float)
@@ -83,16 +104,18 @@ def parse_quantstudio(file_path: str) -> UnifiedData:
         well_id = well_num_to_id(int(well_num))
         cycle = int(cycle_val)
 
-        fam_val = sheet.cell_value(r, fam_col)
-        allele2_val = sheet.cell_value(r, allele2_col)
-        rox_val = sheet.cell_value(r, rox_col) if has_rox else None
+        fam_val = _cell(row, fam_col)
+        allele2_val = _cell(row, allele2_col)
+        rox_val = _cell(row, rox_col) if has_rox else None
 
         # Skip empty wells (dye values are empty strings)
         if not isinstance(fam_val, (int, float)):
             continue
 
+        # model_construct: values are validated by the isinstance checks above,
+        # so skip pydantic's per-field validation on this hot path.
         data.append(
-            WellCycleData(
+            WellCycleData.model_construct(
                 well=well_id,
                 cycle=cycle,
                 fam=float(fam_val),
@@ -107,7 +130,7 @@ def parse_quantstudio(file_path: str) -> UnifiedData:
     return UnifiedData(
         instrument="QuantStudio 3",
         allele2_dye=allele2_dye,
-        wells=sorted(wells_set, key=_well_sort_key),
+        wells=sorted(wells_set, key=_WELL_ORDER.__getitem__),
         cycles=sorted_cycles,
         data=data,
         has_rox=has_rox,
@@ -122,11 +145,10 @@ def parse_quantstudio_amplification(file_path: str) -> UnifiedData:
     Two rows per well per cycle (one per allele target).
     We use Rn values and pivot allele targets into FAM and VIC/HEX channels.
     """
-    wb = xlrd.open_workbook(file_path)
-    sheet = wb.sheet_by_index(0)
+    rows = _load_rows(file_path)
 
-    header_row = find_header_row(sheet)
-    headers = [sheet.cell_value(header_row, c).strip() for c in range(sheet.ncols)]
+    header_row = find_header_row(rows)
+    headers = [str(h).strip() for h in rows[header_row]]
 
     col_map = {}
     for i, h in enumerate(headers):
@@ -141,13 +163,28 @@ def parse_quantstudio_amplification(file_path: str) -> UnifiedData:
     if well_col is None or cycle_col is None or target_col is None or rn_col is None:
         raise ValueError(f"Missing required columns for Amplification Data. Found: {headers}")
 
-    # First pass: collect all target names to identify alleles
+    # Single pass: collect Rn values keyed by (well, cycle, target) and the
+    # target-name set at the same time. Allele identification only needs the
+    # names, so it can run after the scan instead of forcing a second one.
     targets: set[str] = set()
-    data_start = header_row + 1
-    for r in range(data_start, sheet.nrows):
-        t = sheet.cell_value(r, target_col)
-        if isinstance(t, str) and t.strip():
-            targets.add(t.strip())
+    rn_data: dict[tuple[str, int, str], float] = {}
+    for row in rows[header_row + 1:]:
+        well_num = _cell(row, well_col)
+        cycle_val = _cell(row, cycle_col)
+        target = _cell(row, target_col)
+        rn_val = _cell(row, rn_col)
+
+        if not isinstance(target, str) or not target.strip():
+            continue
+        target = target.strip()
+        targets.add(target)
+
+        if not isinstance(well_num, (int, float)) or not isinstance(cycle_val, (int, float)):
+            continue
+        if not isinstance(rn_val, (int, float)):
+            continue
+
+        rn_data[(well_num_to_id(int(well_num)), int(cycle_val), target)] = float(rn_val)
 
     # Identify which target is FAM (Allele 1) and which is VIC/HEX (Allele 2)
     # QS files may label targets as "Allele 1" (=VIC/HEX) and "Allele 2" (=FAM)
@@ -172,25 +209,6 @@ def parse_quantstudio_amplification(file_path: str) -> UnifiedData:
     if not fam_target or not allele2_target:
         raise ValueError(f"Could not identify allele targets. Found targets: {targets}")
 
-    # Second pass: collect Rn values keyed by (well, cycle, target)
-    rn_data: dict[tuple[str, int, str], float] = {}
-    for r in range(data_start, sheet.nrows):
-        well_num = sheet.cell_value(r, well_col)
-        cycle_val = sheet.cell_value(r, cycle_col)
-        target = sheet.cell_value(r, target_col)
-        rn_val = sheet.cell_value(r, rn_col)
-
-        if not isinstance(well_num, (int, float)) or not isinstance(cycle_val, (int, float)):
-            continue
-        if not isinstance(target, str) or not target.strip():
-            continue
-        if not isinstance(rn_val, (int, float)):
-            continue
-
-        well_id = well_num_to_id(int(well_num))
-        cycle = int(cycle_val)
-        rn_data[(well_id, cycle, target.strip())] = float(rn_val)
-
     # Merge into unified data
     well_cycles: set[tuple[str, int]] = set()
     for well_id, cycle, _ in rn_data:
@@ -205,7 +223,7 @@ def parse_quantstudio_amplification(file_path: str) -> UnifiedData:
         allele2_val = rn_data.get((well_id, cycle, allele2_target), 0.0)
 
         data_list.append(
-            WellCycleData(
+            WellCycleData.model_construct(
                 well=well_id,
                 cycle=cycle,
                 fam=fam_val,
@@ -220,15 +238,9 @@ def parse_quantstudio_amplification(file_path: str) -> UnifiedData:
     return UnifiedData(
         instrument="QuantStudio 3",
         allele2_dye=allele2_dye,
-        wells=sorted(wells_set, key=_well_sort_key),
+        wells=sorted(wells_set, key=_WELL_ORDER.__getitem__),
         cycles=sorted_cycles,
         data=data_list,
         has_rox=False,  # Rn is already normalized
         data_windows=[DataWindow(name="Amplification", start_cycle=sorted_cycles[0], end_cycle=sorted_cycles[-1])] if sorted_cycles else None,
     )
-
-
-def _well_sort_key(well: str) -> tuple[int, int]:
-    row = ord(well[0]) - ord("A")
-    col = int(well[1:])
-    return (row, col)
@@ -16,32 +16,101 @@ FILENAME_FIXES = {
 
 
 def fix_cfx_xlsx(input_path: str) -> str:
-    """Fix broken CFX Opus xlsx and return path to fixed temp file."""
+    """Fix broken CFX Opus xlsx and return path to fixed temp file.
+
+    Only entry NAMES are broken, never their contents, so each entry's
+    already-compressed bytes are copied verbatim into the output with a
+    corrected name — no inflate/deflate round-trip (the deflate work, not the
+    rename, is what used to dominate load time on multi-MB sheet XML).
+    """
     fd, fixed_path = tempfile.mkstemp(suffix=".xlsx", prefix="cfx_fixed_")
     os.close(fd)
 
     with zipfile.ZipFile(input_path, "r") as zin:
-        with zipfile.ZipFile(fixed_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        with zipfile.ZipFile(fixed_path, "w") as zout:
             for info in zin.infolist():
-                data = zin.read(info.filename)
-                new_name = info.filename.replace("\\", "/")
-                if new_name.lower() == "[content_types].xml":
-                    new_name = "[Content_Types].xml"
-                if new_name in FILENAME_FIXES:
-                    new_name = FILENAME_FIXES[new_name]
-                zout.writestr(new_name, data)
+                _clone_entry(zin, zout, info, _fixed_name(info.filename))
 
     return fixed_path
 
 
+def _fixed_name(name: str) -> str:
+    """Apply the three CFX Opus name fixes (no-op for well-formed names)."""
+    new_name = name.replace("\\", "/")
+    if new_name.lower() == "[content_types].xml":
+        new_name = "[Content_Types].xml"
+    return FILENAME_FIXES.get(new_name, new_name)
+
+
+def _seek_raw_data(zin: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Position the archive file at the start of an entry's compressed bytes."""
+    fp = zin.fp
+    fp.seek(info.header_offset)
+    header = fp.read(30)  # fixed-size local file header
+    name_len = int.from_bytes(header[26:28], "little")
+    extra_len = int.from_bytes(header[28:30], "little")
+    fp.seek(info.header_offset + 30 + name_len + extra_len)
+    return fp
+
+
+def _clone_entry(
+    zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo, new_name: str
+) -> None:
+    """Append ``info``'s entry to ``zout`` under ``new_name``, reusing the
+    source's compressed stream as-is.
+
+    ``ZipFile`` has no public raw-copy API (``open()/writestr()`` always run
+    the codec), so this writes the local header itself and registers the entry
+    the same way ``writestr`` does.
+    """
+    zinfo = zipfile.ZipInfo(new_name, date_time=info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.comment = info.comment
+    zinfo.extra = info.extra
+    zinfo.create_system = info.create_system
+    zinfo.external_attr = info.external_attr
+    zinfo.internal_attr = info.internal_attr
+    # Sizes/CRC come from the central directory, so the data-descriptor bit
+    # (0x08: "sizes follow the data") must not be carried over.
+    zinfo.flag_bits = info.flag_bits & ~0x08
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+
+    zout._writecheck(zinfo)
+    zout._didModify = True
+    zinfo.header_offset = zout.fp.tell()
+    zip64 = max(info.file_size, info.compress_size) > zipfile.ZIP64_LIMIT
+    zout.fp.write(zinfo.FileHeader(zip64))
+
+    # Stream the compressed bytes in 64 KB chunks — a multi-MB sheet XML entry
+    # never sits in memory whole.
+    src = _seek_raw_data(zin, info)
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = src.read(min(65536, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated entry data for {info.filename!r}")
+        zout.fp.write(chunk)
+        remaining -= len(chunk)
+
+    zout.start_dir = zout.fp.tell()
+    zout.filelist.append(zinfo)
+    zout.NameToInfo[zinfo.filename] = zinfo
+
+
 def needs_fixing(path: str) -> bool:
     """Check if an xlsx file has the CFX Opus broken packaging."""
     try:
         with zipfile.ZipFile(path, "r") as z:
-            names = z.namelist()
-            return any("\\" in n for n in names) or any(
-                n.lower() == "[content_types].xml" and n != "[Content_Types].xml"
-                for n in names
+            # NameToInfo is already populated during open; iterating its keys
+            # in one any() short-circuits on the first offending name instead
+            # of materializing namelist() and walking it twice.
+            return any(
+                "\\" in n
+                or (n.lower() == "[content_types].xml" and n != "[Content_Types].xml")
+                or n in FILENAME_FIXES
+                for n in z.NameToInfo
             )
     except zipfile.BadZipFile:
         return False
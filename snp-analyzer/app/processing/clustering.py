@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
+
 from app.models import ThresholdConfig, WellType
 from app.processing.genotype_vocab import (
     DEFAULT_PLOIDY,
     genotype_label,
+    genotype_labels,
     label_by_ratio,
     validate_ploidy,
 )
@@ -80,22 +83,37 @@ def cluster_threshold(
     validate_ploidy(ploidy)
     cuts = config.boundaries
 
-    assignments: dict[str, str] = {}
-    for p in points:
-        total = p["norm_fam"] + p["norm_allele2"]
-        if total < config.ntc_threshold:
-            assignments[p["well"]] = WellType.NTC.value
-            continue
-        ratio = p["norm_fam"] / total
-        if cuts:
-            assignments[p["well"]] = label_by_ratio(ratio, ploidy, cuts, config.offset)
-        elif ratio > config.allele2_ratio_min:
-            assignments[p["well"]] = WellType.ALLELE1_HOMO.value
-        elif ratio < config.allele1_ratio_max:
-            assignments[p["well"]] = WellType.ALLELE2_HOMO.value
-        else:
-            assignments[p["well"]] = WellType.HETEROZYGOUS.value
-    return assignments
+    if not points:
+        return {}
+
+    n = len(points)
+    wells = [p["well"] for p in points]
+    fam = np.fromiter((p["norm_fam"] for p in points), dtype=np.float64, count=n)
+    allele2 = np.fromiter((p["norm_allele2"] for p in points), dtype=np.float64, count=n)
+    total = fam + allele2
+    ratio = np.divide(fam, total, out=np.zeros_like(total), where=total != 0)
+
+    ntc = total < config.ntc_threshold
+    labels = np.empty(n, dtype=object)
+    labels[ntc] = WellType.NTC.value
+    sig_ratio = ratio[~ntc]
+
+    if cuts:
+        # dosage = offset + number of (descending) cuts met — one comparison
+        # matrix instead of a per-point dosage_by_ratio call.
+        dosage = config.offset + (sig_ratio[:, None] >= np.asarray(cuts, dtype=np.float64)).sum(axis=1)
+        if dosage.size and not (0 <= int(dosage.min()) and int(dosage.max()) <= ploidy):
+            bad = int(dosage.min()) if int(dosage.min()) < 0 else int(dosage.max())
+            raise ValueError(f"dosage {bad} out of range for ploidy {ploidy}")
+        labels[~ntc] = np.array(genotype_labels(ploidy), dtype=object)[dosage]
+    else:
+        labels[~ntc] = np.select(
+            [sig_ratio > config.allele2_ratio_min, sig_ratio < config.allele1_ratio_max],
+            [WellType.ALLELE1_HOMO.value, WellType.ALLELE2_HOMO.value],
+            default=WellType.HETEROZYGOUS.value,
+        )
+
+    return dict(zip(wells, labels.tolist()))
 
 
 def boundary_confidences(
@@ -767,9 +785,6 @@ def _resolve_anchor_dosages(
 
 
 def cluster_kmeans(points: list[dict], n_clusters: int = 4) -> dict[str, str]:
-    import numpy as np
-    from sklearn.cluster import KMeans
-
     if not points:
         return {}
 
@@ -781,39 +796,71 @@ def cluster_kmeans(points: list[dict], n_clusters: int = 4) -> dict[str, str]:
     if actual_k < 2:
         return {w: WellType.UNKNOWN.value for w in wells}
 
-    km = KMeans(n_clusters=actual_k, n_init=10, random_state=42)
-    labels = km.fit_predict(coords)
-    centers = km.cluster_centers_
+    labels, centers = _kmeans2d(coords, actual_k)
 
     cluster_labels = _label_clusters(centers)
 
-    return {well: cluster_labels[label] for well, label in zip(wells, labels)}
+    return {well: cluster_labels[int(label)] for well, label in zip(wells, labels)}
 
 
-def _label_clusters(centers) -> dict[int, str]:
-    n = len(centers)
-    labels: dict[int, str] = {}
+def _kmeans2d(
+    coords: np.ndarray, k: int, n_init: int = 10, max_iter: int = 20, seed: int = 42
+) -> tuple[np.ndarray, np.ndarray]:
+    """Lloyd's k-means for the tiny 2-D plate problem (k<=4, <=384 points).
 
-    center_info = []
-    for i, (fam, allele2) in enumerate(centers):
-        total = fam + allele2
-        ratio = fam / total if total > 0 else 0.5
-        center_info.append((i, total, ratio))
+    Full sklearn KMeans machinery (validation, threading, n_init dispatch) is
+    overkill at this size — a direct restart loop with k-means++ seeding
+    converges in microseconds and keeps the fixed-seed determinism. Returns
+    ``(labels, centers)``; the best of ``n_init`` restarts by inertia wins.
+    """
+    n = len(coords)
+    rng = np.random.default_rng(seed)
+    best_inertia = float("inf")
+    best_labels = best_centers = None
+
+    for _ in range(n_init):
+        # k-means++ seeding: next center drawn proportional to squared
+        # distance from the nearest already-chosen center.
+        centers = np.empty((k, coords.shape[1]))
+        centers[0] = coords[rng.integers(n)]
+        d2 = ((coords - centers[0]) ** 2).sum(1)
+        for j in range(1, k):
+            total = d2.sum()
+            idx = rng.choice(n, p=d2 / total) if total > 0 else rng.integers(n)
+            centers[j] = coords[idx]
+            d2 = np.minimum(d2, ((coords - centers[j]) ** 2).sum(1))
+
+        prev = None
+        for _ in range(max_iter):
+            dists = ((coords[:, None, :] - centers[None, :, :]) ** 2).sum(-1)
+            labels = dists.argmin(1)
+            if prev is not None and np.array_equal(labels, prev):
+                break
+            prev = labels
+            for j in range(k):
+                members = coords[labels == j]
+                if len(members):  # empty cluster keeps its previous center
+                    centers[j] = members.mean(0)
+
+        inertia = float(((coords - centers[labels]) ** 2).sum())
+        if inertia < best_inertia:
+            best_inertia, best_labels, best_centers = inertia, labels, centers
+
+    return best_labels, best_centers
 
-    by_total = sorted(center_info, key=lambda x: x[1])
 
-    # Lowest total -> NTC if signal is very low
-    if by_total[0][1] < 0.5:
-        labels[by_total[0][0]] = WellType.NTC.value
+def _label_clusters(centers) -> dict[int, str]:
+    centers = np.asarray(centers, dtype=float)
+    totals = centers.sum(1)
+    ratios = np.divide(centers[:, 0], totals, out=np.full(totals.shape, 0.5), where=totals > 0)
 
-    for i, total, ratio in center_info:
-        if i in labels:
-            continue
-        # Diploid label via the central vocabulary (was an inline 0.6/0.4 cut).
-        labels[i] = label_by_ratio(ratio, 2, [0.6, 0.4])
+    # Diploid label via the central vocabulary (descending 0.6/0.4 cuts), as
+    # one comparison matrix instead of per-center label_by_ratio calls.
+    dosage = (ratios[:, None] >= np.array([0.6, 0.4])).sum(1)
+    labels = np.array(genotype_labels(2), dtype=object)[dosage]
 
-    for i in range(n):
-        if i not in labels:
-            labels[i] = WellType.UNKNOWN.value
+    # Lowest total -> NTC if signal is very low
+    if totals.size and totals.min() < 0.5:
+        labels[totals.argmin()] = WellType.NTC.value
 
-    return labels
+    return dict(enumerate(labels.tolist()))
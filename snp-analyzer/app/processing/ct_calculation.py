@@ -1,6 +1,27 @@
 """Ct/Cq calculation using auto-threshold method."""
 from __future__ import annotations
 
+import numpy as np
+
+
+def _mean_std(values) -> tuple[float, float]:
+    """Single-pass mean and population std (Welford's online algorithm).
+
+    Halves the baseline traversals of the two-pass sum()/variance pair on the
+    innermost Ct loop, and is numerically stabler for near-constant baselines.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in values:
+        n += 1
+        d = v - mean
+        mean += d / n
+        m2 += d * (v - mean)
+    if n == 0:
+        return 0.0, 0.0
+    return mean, (m2 / n) ** 0.5
+
 
 def auto_threshold(values: list[float], baseline_cycles: int = 5, n_sigma: float = 10.0) -> float:
     """Calculate auto-threshold from baseline region.
@@ -16,10 +37,7 @@ def auto_threshold(values: list[float], baseline_cycles: int = 5, n_sigma: float
     if len(values) < baseline_cycles:
         baseline_cycles = max(1, len(values) // 2)
 
-    baseline = values[:baseline_cycles]
-    mean_bl = sum(baseline) / len(baseline)
-    variance = sum((v - mean_bl) ** 2 for v in baseline) / len(baseline)
-    std_bl = variance ** 0.5
+    mean_bl, std_bl = _mean_std(values[:baseline_cycles])
 
     return mean_bl + n_sigma * std_bl
 
@@ -48,10 +66,7 @@ def calculate_ct(
 
     # Baseline stats
     bl_n = min(baseline_cycles, len(values) // 2) or 1
-    baseline = values[:bl_n]
-    mean_bl = sum(baseline) / len(baseline)
-    variance = sum((v - mean_bl) ** 2 for v in baseline) / len(baseline)
-    std_bl = variance ** 0.5
+    mean_bl, std_bl = _mean_std(values[:bl_n])
 
     if threshold is None:
         threshold = mean_bl + n_sigma * std_bl
@@ -77,6 +92,38 @@ def calculate_ct(
     }
 
 
+def _ct_matrix(
+    values: np.ndarray,
+    cycles: np.ndarray,
+    baseline_cycles: int = 5,
+    n_sigma: float = 10.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """calculate_ct over a ``(n_wells, n_cycles)`` matrix in one fused pass.
+
+    Returns ``(ct, threshold, baseline_mean)`` arrays (one entry per row);
+    ``ct`` is NaN where the curve never crosses its threshold.
+    """
+    bl_n = min(baseline_cycles, values.shape[1] // 2) or 1
+    bl = values[:, :bl_n]
+    mean_bl = bl.mean(1)
+    thr = mean_bl + n_sigma * bl.std(1)
+
+    # First i with values[i] < threshold <= values[i+1], per row.
+    t = thr[:, None]
+    crossing = (values[:, :-1] < t) & (t <= values[:, 1:])
+    has_ct = crossing.any(1)
+    idx = crossing.argmax(1)
+    rows = np.arange(values.shape[0])
+    v0 = values[rows, idx]
+    denom = values[rows, idx + 1] - v0
+
+    # Linear interpolation (denom is positive by construction of the mask; the
+    # guard mirrors the scalar path's defensive branch).
+    frac = np.divide(thr - v0, denom, out=np.zeros_like(denom), where=denom > 0)
+    ct = np.where(denom > 0, cycles[idx] + frac * (cycles[idx + 1] - cycles[idx]), cycles[idx])
+    return np.where(has_ct, ct, np.nan), thr, mean_bl
+
+
 def calculate_all_ct(unified_data, use_rox: bool = True) -> dict[str, dict]:
     """Calculate Ct for all wells, both FAM and Allele2 channels.
 
@@ -87,24 +134,64 @@ def calculate_all_ct(unified_data, use_rox: bool = True) -> dict[str, dict]:
     Returns:
         dict[well] -> {fam_ct, allele2_ct, fam_threshold, allele2_threshold, ...}
     """
+    from app.models import UnifiedData
     from app.processing.normalize import normalize
 
-    all_norm = normalize(unified_data, use_rox=use_rox)
+    # get_normalized shares one normalization pass with quality scoring when
+    # both run over the same session (report generation).
+    if isinstance(unified_data, UnifiedData):
+        all_norm = unified_data.get_normalized(use_rox)
+    else:
+        all_norm = normalize(unified_data, use_rox=use_rox)
 
     # Group by well
     well_data: dict[str, list] = {}
     for p in all_norm:
         well_data.setdefault(p.well, []).append(p)
 
+    for points in well_data.values():
+        points.sort(key=lambda p: p.cycle)
+
+    # Fast path: every well read the same cycles (the normal case). Stack the
+    # plate into (n_wells, n_cycles) matrices and run one vectorized pass per
+    # channel instead of thousands of per-cycle Python iterations.
+    wells = list(well_data)
+    ref_cycles = [p.cycle for p in well_data[wells[0]]] if wells else []
+    uniform = len(ref_cycles) >= 3 and all(
+        [p.cycle for p in pts] == ref_cycles for pts in well_data.values()
+    )
+
     results = {}
+    if uniform:
+        cycles_arr = np.asarray(ref_cycles, dtype=np.float64)
+        channels = {}
+        for name, attr in (("fam", "norm_fam"), ("allele2", "norm_allele2")):
+            mat = np.array([[getattr(p, attr) for p in well_data[w]] for w in wells])
+            ct, thr, mean_bl = _ct_matrix(mat, cycles_arr)
+            channels[name] = (
+                [None if c != c else round(c, 2) for c in ct.tolist()],
+                np.round(thr, 4).tolist(),
+                np.round(mean_bl, 4).tolist(),
+            )
+        fam_ct, fam_thr, fam_bl = channels["fam"]
+        a2_ct, a2_thr, a2_bl = channels["allele2"]
+        for i, well in enumerate(wells):
+            results[well] = {
+                "well": well,
+                "fam_ct": fam_ct[i],
+                "fam_threshold": fam_thr[i],
+                "fam_baseline_mean": fam_bl[i],
+                "allele2_ct": a2_ct[i],
+                "allele2_threshold": a2_thr[i],
+                "allele2_baseline_mean": a2_bl[i],
+            }
+        return results
+
+    # Ragged cycles (or <3 of them): per-well scalar path.
     for well, points in well_data.items():
-        points.sort(key=lambda p: p.cycle)
         cycles = [p.cycle for p in points]
-        fam_values = [p.norm_fam for p in points]
-        allele2_values = [p.norm_allele2 for p in points]
-
-        fam_result = calculate_ct(fam_values, cycles)
-        allele2_result = calculate_ct(allele2_values, cycles)
+        fam_result = calculate_ct([p.norm_fam for p in points], cycles)
+        allele2_result = calculate_ct([p.norm_allele2 for p in points], cycles)
 
         results[well] = {
             "well": well,
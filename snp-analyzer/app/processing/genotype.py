@@ -1,6 +1,9 @@
 """Shared genotype classification logic."""
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
+
 from app.processing.genotype_vocab import (
     DEFAULT_PLOIDY,
     genotype_labels,
@@ -29,6 +32,14 @@ def get_effective_types(
 GENOTYPED_TYPES = set(genotyped_types(2))            # {"Allele 1 Homo","Allele 2 Homo","Heterozygous"}
 EXCLUDED_TYPES = {"NTC", "Unknown", "Positive Control", "Undetermined"}
 
+# Diploid label -> count bucket; one hash lookup per well instead of up to
+# three string comparisons in an if/elif chain.
+_GT_TABLE = {
+    "Allele 1 Homo": "AA",
+    "Allele 2 Homo": "BB",
+    "Heterozygous": "AB",
+}
+
 
 def count_genotypes(
     effective_types: dict[str, str], ploidy: int = DEFAULT_PLOIDY
@@ -40,25 +51,29 @@ def count_genotypes(
 
     For higher ploidy the counts are keyed by dosage-class label (dosage 0..P,
     e.g. "AAAB") plus 'excluded'."""
+    return count_genotypes_from_tally(Counter(effective_types.values()), ploidy)
+
+
+def count_genotypes_from_tally(
+    tally: Mapping[str, int], ploidy: int = DEFAULT_PLOIDY
+) -> dict[str, int]:
+    """Same as :func:`count_genotypes`, but from a genotype -> count tally.
+
+    Lets callers that already tallied genotypes (e.g. the batch summary's
+    single fused pass) derive the category counts without rescanning wells."""
     if ploidy == 2:
         counts = {"AA": 0, "BB": 0, "AB": 0, "excluded": 0}
-        for gt in effective_types.values():
-            if gt == "Allele 1 Homo":
-                counts["AA"] += 1
-            elif gt == "Allele 2 Homo":
-                counts["BB"] += 1
-            elif gt == "Heterozygous":
-                counts["AB"] += 1
-            else:
-                counts["excluded"] += 1
+        table_get = _GT_TABLE.get
+        for gt, n in tally.items():
+            counts[table_get(gt, "excluded")] += n
         return counts
 
     labels = genotype_labels(ploidy)
     counts = {label: 0 for label in labels}
     counts["excluded"] = 0
-    for gt in effective_types.values():
+    for gt, n in tally.items():
         if gt in counts and gt != "excluded":
-            counts[gt] += 1
+            counts[gt] += n
         else:
-            counts["excluded"] += 1
+            counts["excluded"] += n
     return counts
@@ -1,3 +1,7 @@
+from collections import OrderedDict
+
+import numpy as np
+
 from app.models import NormalizedPoint, UnifiedData, WellCycleData
 
 
@@ -11,25 +15,83 @@ def normalize(
     use_rox: bool = True,
 ) -> list[NormalizedPoint]:
     readings, apply_normalization = _normalization_context(data, has_rox, use_rox)
-    results = []
-    for d in readings:
-        reference_value = _normalization_value(d)
-        if apply_normalization and reference_value and reference_value > 0:
-            norm_fam = d.fam / reference_value
-            norm_allele2 = d.allele2 / reference_value
-        else:
-            norm_fam = d.fam
-            norm_allele2 = d.allele2
-        results.append(NormalizedPoint(
+    if not readings:
+        return []
+
+    cols = normalize_columns(readings, apply_normalization)
+    norm_fam = np.round(cols["norm_fam"], 6).tolist()
+    norm_allele2 = np.round(cols["norm_allele2"], 6).tolist()
+    raw_fam = np.round(cols["raw_fam"], 4).tolist()
+    raw_allele2 = np.round(cols["raw_allele2"], 4).tolist()
+    # NaN marks "no reference value" (see normalize_columns) -> None at the boundary.
+    raw_rox = [None if r != r else r for r in np.round(cols["raw_rox"], 4).tolist()]
+
+    return [
+        NormalizedPoint(
             well=d.well,
             cycle=d.cycle,
-            norm_fam=round(norm_fam, 6),
-            norm_allele2=round(norm_allele2, 6),
-            raw_fam=round(d.fam, 4),
-            raw_allele2=round(d.allele2, 4),
-            raw_rox=round(reference_value, 4) if reference_value is not None else None,
-        ))
-    return results
+            norm_fam=nf,
+            norm_allele2=na,
+            raw_fam=rf,
+            raw_allele2=ra,
+            raw_rox=rr,
+        )
+        for d, nf, na, rf, ra, rr in zip(
+            readings, norm_fam, norm_allele2, raw_fam, raw_allele2, raw_rox
+        )
+    ]
+
+
+def normalize_columns(
+    readings: list[WellCycleData], apply_normalization: bool
+) -> dict[str, np.ndarray]:
+    """Columnar (SoA) normalization over all readings in one vectorized pass.
+
+    Returns float64 arrays keyed ``norm_fam`` / ``norm_allele2`` / ``raw_fam`` /
+    ``raw_allele2`` / ``raw_rox``, parallel to ``readings``. A missing reference
+    value is NaN in ``raw_rox``. Readings without a positive reference pass
+    through unnormalized, matching the per-row behavior this replaces.
+    """
+    n = len(readings)
+    raw_fam = np.fromiter((d.fam for d in readings), dtype=np.float64, count=n)
+    raw_allele2 = np.fromiter((d.allele2 for d in readings), dtype=np.float64, count=n)
+    ref = np.fromiter(
+        (
+            d.normalization_value
+            if d.normalization_value is not None
+            else (d.rox if d.rox is not None else np.nan)
+            for d in readings
+        ),
+        dtype=np.float64,
+        count=n,
+    )
+
+    if apply_normalization:
+        # Multiply by the reciprocal (one division per point saved); NaN/<=0
+        # references fall through to 1.0, i.e. raw passthrough.
+        inv_ref = np.divide(1.0, ref, out=np.ones_like(ref), where=ref > 0)
+        norm_fam = raw_fam * inv_ref
+        norm_allele2 = raw_allele2 * inv_ref
+    else:
+        norm_fam = raw_fam
+        norm_allele2 = raw_allele2
+
+    return {
+        "norm_fam": norm_fam,
+        "norm_allele2": norm_allele2,
+        "raw_fam": raw_fam,
+        "raw_allele2": raw_allele2,
+        "raw_rox": ref,
+    }
+
+
+# (id(unified), cycle, has_rox, use_rox) -> (unified, points). Scatter, plate,
+# export and compare all re-normalize the same cycle while the user pans the
+# UI. Entries hold a strong reference to the UnifiedData they were built from
+# and hits require `is` on it, so a recycled id() after a re-upload can never
+# serve stale points; LRU eviction bounds the pinned sessions.
+_CYCLE_CACHE: OrderedDict[tuple, tuple[UnifiedData, list[NormalizedPoint]]] = OrderedDict()
+_CYCLE_CACHE_MAX = 32
 
 
 def normalize_for_cycle(
@@ -39,9 +101,20 @@ def normalize_for_cycle(
     use_rox: bool = True,
 ) -> list[NormalizedPoint]:
     if isinstance(data, UnifiedData):
+        key = (id(data), cycle, has_rox, use_rox)
+        hit = _CYCLE_CACHE.get(key)
+        if hit is not None and hit[0] is data:
+            _CYCLE_CACHE.move_to_end(key)
+            return hit[1]
+
         cycle_data = [d for d in data.data if d.cycle == cycle]
         scoped = data.model_copy(update={"data": cycle_data})
-        return normalize(scoped, has_rox, use_rox)
+        points = normalize(scoped, has_rox, use_rox)
+
+        _CYCLE_CACHE[key] = (data, points)
+        if len(_CYCLE_CACHE) > _CYCLE_CACHE_MAX:
+            _CYCLE_CACHE.popitem(last=False)
+        return points
 
     cycle_data = [d for d in data if d.cycle == cycle]
     return normalize(cycle_data, has_rox, use_rox)
@@ -66,9 +139,3 @@ def _normalization_context(
     if mode == RAW_MODE:
         return data.data, False
     return data.data, bool(requested and data.normalization_channel and mode == PASSIVE_REFERENCE_MODE)
-
-
-def _normalization_value(reading: WellCycleData) -> float | None:
-    if reading.normalization_value is not None:
-        return reading.normalization_value
-    return reading.rox
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from app.models import UnifiedData, DataWindow
 from app.processing.normalize import normalize_for_cycle
 
@@ -17,14 +19,24 @@ def compute_suggested_cycle(unified: UnifiedData) -> int | None:
 
     Returns the cycle just before NTC amplification onset, or the last
     amplification cycle when there is no contamination. This is cheap (no
-    clustering) so it stays fast on the upload path.
+    clustering) so it stays fast on the upload path. The result is
+    deterministic for a given session's readings, so it is memoized on the
+    UnifiedData instance — GET /api/sessions/{sid} calls this on every load.
     """
+    cached = unified._suggested_cycle
+    if cached is not None:
+        return cached[0]
+
     info = _analyze_amplification(unified)
     if info is None:
-        return None
-    if info["ntc_onset_cycle"] is not None:
-        return max(info["amp_start"], min(info["ntc_onset_cycle"] - 1, info["amp_end"]))
-    return info["amp_end"]
+        suggested = None
+    elif info["ntc_onset_cycle"] is not None:
+        suggested = max(info["amp_start"], min(info["ntc_onset_cycle"] - 1, info["amp_end"]))
+    else:
+        suggested = info["amp_end"]
+
+    unified._suggested_cycle = (suggested,)
+    return suggested
 
 
 def compute_cycle_suggestion(unified: UnifiedData) -> dict:
@@ -126,18 +138,19 @@ def _analyze_amplification(unified: UnifiedData) -> dict | None:
         return info
 
     # Per-well signal curves (raw FAM + allele2, no normalization)
-    well_curves = _build_well_curves(unified, amp_cycles)
-    if len(well_curves) < 3:
+    wells, curves = _build_well_curves(unified, amp_cycles)
+    if len(wells) < 3:
         return info
 
-    ntc_wells = _detect_ntc_wells(well_curves, amp_cycles)
+    ntc_wells = _detect_ntc_wells(wells, curves)
     info["ntc_wells"] = ntc_wells
     if not ntc_wells:
         return info
 
+    row_of = {w: i for i, w in enumerate(wells)}
     earliest_ct = None
     for well in ntc_wells:
-        ct = _second_derivative_ct(well_curves[well], amp_cycles)
+        ct = _second_derivative_ct(curves[row_of[well]], amp_cycles)
         if ct is not None and (earliest_ct is None or ct < earliest_ct):
             earliest_ct = ct
     info["ntc_onset_cycle"] = earliest_ct
@@ -218,33 +231,36 @@ def _get_amplification_window(windows: list[DataWindow] | None) -> DataWindow |
 
 def _build_well_curves(
     unified: UnifiedData, amp_cycles: list[int]
-) -> dict[str, list[float]]:
+) -> tuple[list[str], np.ndarray]:
     """Build per-well total signal curves for the amplification window.
 
     Uses raw FAM + allele2 (no ROX normalization) to avoid artifacts.
+    Returns ``(wells, curves)`` where ``curves[i]`` is ``wells[i]``'s curve
+    over ``amp_cycles`` — SoA layout, so the downstream gap/onset analysis
+    runs on a dense matrix instead of nested dicts. Only wells with a reading
+    at every amplification cycle are kept.
     """
-    cycle_set = set(amp_cycles)
-    well_data: dict[str, dict[int, float]] = {}
+    cycle_to_idx = {c: i for i, c in enumerate(amp_cycles)}
+    well_to_row: dict[str, int] = {}
+    for d in unified.data:
+        if d.cycle in cycle_to_idx and d.well not in well_to_row:
+            well_to_row[d.well] = len(well_to_row)
 
+    curves = np.zeros((len(well_to_row), len(amp_cycles)))
+    filled = np.zeros(curves.shape, dtype=bool)
     for d in unified.data:
-        if d.cycle not in cycle_set:
-            continue
-        if d.well not in well_data:
-            well_data[d.well] = {}
-        well_data[d.well][d.cycle] = d.fam + d.allele2
+        i = cycle_to_idx.get(d.cycle)
+        if i is not None:
+            row = well_to_row[d.well]
+            curves[row, i] = d.fam + d.allele2
+            filled[row, i] = True
 
-    # Convert to ordered lists, only wells with complete data
-    result = {}
-    for well, cycle_map in well_data.items():
-        if len(cycle_map) == len(amp_cycles):
-            result[well] = [cycle_map[c] for c in amp_cycles]
+    complete = filled.all(1)
+    wells = [w for w, r in well_to_row.items() if complete[r]]
+    return wells, curves[complete]
 
-    return result
 
-
-def _detect_ntc_wells(
-    well_curves: dict[str, list[float]], amp_cycles: list[int]
-) -> list[str]:
+def _detect_ntc_wells(wells: list[str], curves: np.ndarray) -> list[str]:
     """Detect NTC wells using signal delta gap analysis.
 
     For each well, compute delta = last_signal - first_signal.
@@ -252,41 +268,28 @@ def _detect_ntc_wells(
     wells below the gap are NTC candidates.
     Limit to at most 4 NTC wells.
     """
-    deltas = {}
-    for well, curve in well_curves.items():
-        deltas[well] = curve[-1] - curve[0]
-
-    sorted_wells = sorted(deltas.keys(), key=lambda w: deltas[w])
-    sorted_deltas = [deltas[w] for w in sorted_wells]
+    deltas = curves[:, -1] - curves[:, 0]
 
     # Need at least some wells with positive delta to have a reference
-    max_delta = max(sorted_deltas)
+    max_delta = float(deltas.max())
     if max_delta <= 0:
         return []
 
-    # Find gap: look for >3x jump in absolute delta values
-    # Only consider wells in the bottom portion as NTC candidates
-    gap_idx = None
-    for i in range(len(sorted_deltas) - 1):
-        curr = abs(sorted_deltas[i])
-        next_val = abs(sorted_deltas[i + 1])
-        # Gap detection: next value is >3x current AND current is small relative to max
-        if next_val > 3 * max(curr, 1) and curr < max_delta * 0.15:
-            gap_idx = i
-            break
-
-    if gap_idx is None:
-        # No clear gap — try percentage-based fallback
-        # Wells with delta < 5% of median are NTC candidates
-        abs_deltas = sorted(abs(d) for d in sorted_deltas)
-        median_delta = abs_deltas[len(abs_deltas) // 2]
-        if median_delta <= 0:
-            return []
-        ntc_candidates = [w for w in sorted_wells if abs(deltas[w]) < median_delta * 0.05]
-        return ntc_candidates[:4]
-
-    ntc_candidates = sorted_wells[: gap_idx + 1]
-    return ntc_candidates[:4]
+    order = np.argsort(deltas, kind="stable")
+    s = np.abs(deltas[order])
+
+    # Find gap: first >3x jump in absolute delta values, only considering
+    # wells in the bottom portion (small relative to max) as NTC candidates.
+    gaps = np.flatnonzero((s[1:] > 3 * np.maximum(s[:-1], 1)) & (s[:-1] < max_delta * 0.15))
+    if gaps.size:
+        return [wells[i] for i in order[: gaps[0] + 1][:4]]
+
+    # No clear gap — percentage-based fallback: wells with delta < 5% of the
+    # median absolute delta (upper median, matching the old sorted[n//2] pick).
+    median_delta = float(np.sort(np.abs(deltas))[len(wells) // 2])
+    if median_delta <= 0:
+        return []
+    return [wells[i] for i in order[s < median_delta * 0.05][:4]]
 
 
 def _second_derivative_ct(
@@ -307,11 +310,11 @@ def _second_derivative_ct(
     if n < 5:
         return None
 
-    # Compute 2nd derivative: d2[j] = curve[j+1] - 2*curve[j] + curve[j-1]
+    arr = np.asarray(curve, dtype=np.float64)
+
+    # 2nd derivative: d2[j] = curve[j+1] - 2*curve[j] + curve[j-1]
     # d2[j] corresponds to curve index j+1, cycle cycles[j+1]
-    d2 = []
-    for j in range(1, n - 1):
-        d2.append(curve[j + 1] - 2 * curve[j] + curve[j - 1])
+    d2 = arr[2:] - 2.0 * arr[1:-1] + arr[:-2]
 
     if len(d2) < baseline_cycles + 2:
         return None
@@ -319,32 +322,19 @@ def _second_derivative_ct(
     # Baseline d2 statistics (first few points)
     bl_n = min(baseline_cycles, len(d2) // 2)
     bl = d2[:bl_n]
-    mean_d2 = sum(bl) / len(bl)
-    var_d2 = sum((v - mean_d2) ** 2 for v in bl) / len(bl)
-    std_d2 = var_d2 ** 0.5
-
-    threshold_d2 = mean_d2 + n_sigma * max(std_d2, 1e-6)
-
-    # Find first d2 exceeding threshold (skip first 2 for noise)
-    onset_d2_idx = None
-    for i in range(2, len(d2)):
-        if d2[i] > threshold_d2:
-            onset_d2_idx = i
-            break
+    threshold_d2 = float(bl.mean()) + n_sigma * max(float(bl.std()), 1e-6)
 
-    if onset_d2_idx is None:
+    # First d2 exceeding threshold (skip first 2 for noise)
+    above = np.nonzero(d2[2:] > threshold_d2)[0]
+    if above.size == 0:
         return None
 
     # Map back to curve index: d2[j] → curve[j+1]
-    onset_curve_idx = onset_d2_idx + 1
+    onset_curve_idx = int(above[0]) + 3
 
     # Validate: consecutive increasing signal cycles from the onset
-    consecutive_up = 0
-    for i in range(onset_curve_idx, n - 1):
-        if curve[i + 1] > curve[i]:
-            consecutive_up += 1
-        else:
-            break
+    rising = np.diff(arr[onset_curve_idx:]) > 0
+    consecutive_up = int(rising.size if rising.all() else rising.argmin())
 
     if consecutive_up < min_consecutive_up:
         return None
@@ -1,6 +1,10 @@
 """Per-well signal quality scoring (0-100)."""
 from __future__ import annotations
 
+import numpy as np
+
+from app.processing.ct_calculation import _mean_std
+
 
 def _linear_score(value: float, low: float, high: float, max_points: float) -> float:
     """Linear interpolation between low (0 points) and high (max_points)."""
@@ -21,9 +25,7 @@ def _well_stats(
     max_signal = max(dominant)
 
     bl_n = min(baseline_cycles, len(dominant) // 2) or 1
-    baseline = dominant[:bl_n]
-    bl_mean = sum(baseline) / len(baseline)
-    bl_std = (sum((v - bl_mean) ** 2 for v in baseline) / len(baseline)) ** 0.5
+    bl_mean, bl_std = _mean_std(dominant[:bl_n])
 
     signal_range = max_signal - bl_mean
     noise_frac = bl_std / max(abs(signal_range), 1e-9)
@@ -107,15 +109,35 @@ def score_all_wells(unified_data, use_rox: bool = True) -> dict[str, dict]:
 
     Returns: dict[well] -> quality score dict
     """
+    from app.models import UnifiedData
     from app.processing.normalize import normalize
 
-    all_norm = normalize(unified_data, use_rox=use_rox)
+    # Same memoized pass calculate_all_ct uses (see UnifiedData.get_normalized).
+    if isinstance(unified_data, UnifiedData):
+        all_norm = unified_data.get_normalized(use_rox)
+    else:
+        all_norm = normalize(unified_data, use_rox=use_rox)
 
     # Group by well
     well_data: dict[str, list] = {}
     for p in all_norm:
         well_data.setdefault(p.well, []).append(p)
 
+    for points in well_data.values():
+        points.sort(key=lambda p: p.cycle)
+
+    # Fast path (the normal case): every well read the same cycles, so the
+    # plate stacks into (n_wells, n_cycles) matrices and all per-well stats,
+    # the plate-wide references, and the scores come out of one vectorized
+    # pass instead of two per-well Python loops.
+    wells = list(well_data)
+    n_cycles = len(well_data[wells[0]]) if wells else 0
+    if n_cycles >= 3 and all(len(pts) == n_cycles for pts in well_data.values()):
+        fam = np.array([[p.norm_fam for p in well_data[w]] for w in wells])
+        allele2 = np.array([[p.norm_allele2 for p in well_data[w]] for w in wells])
+        return _score_matrix(wells, fam, allele2)
+
+    # Ragged (or too-short) wells: per-well scalar path.
     # Plate-wide references (median peak signal + median baseline noise). Every
     # threshold is a fraction of these, so the score is invariant to the plate's
     # absolute scale (low-ROX kits) AND to a uniform normalization artifact.
@@ -123,7 +145,6 @@ def score_all_wells(unified_data, use_rox: bool = True) -> dict[str, dict]:
     peaks: list[float] = []
     noise_fracs: list[float] = []
     for well, points in well_data.items():
-        points.sort(key=lambda p: p.cycle)
         fam_values = [p.norm_fam for p in points]
         allele2_values = [p.norm_allele2 for p in points]
         per_well_curves[well] = (fam_values, allele2_values)
@@ -143,3 +164,55 @@ def score_all_wells(unified_data, use_rox: bool = True) -> dict[str, dict]:
         results[well]["well"] = well
 
     return results
+
+
+def _score_matrix(
+    wells: list[str], fam: np.ndarray, allele2: np.ndarray, baseline_cycles: int = 5
+) -> dict[str, dict]:
+    """score_well over the whole plate at once (same math, SoA layout)."""
+    # _well_stats, vectorized: dominant channel, peak, baseline mean/noise.
+    dominant = np.where((fam.max(1) >= allele2.max(1))[:, None], fam, allele2)
+    max_signal = dominant.max(1)
+    bl_n = min(baseline_cycles, dominant.shape[1] // 2) or 1
+    bl = dominant[:, :bl_n]
+    bl_mean = bl.mean(1)
+    signal_range = max_signal - bl_mean
+    noise_frac = bl.std(1) / np.maximum(np.abs(signal_range), 1e-9)
+
+    # Plate references keep the scalar path's upper-median (sorted[n//2]).
+    signal_ref = float(np.sort(max_signal)[len(wells) // 2])
+    noise_ref = float(np.sort(noise_frac)[len(wells) // 2])
+    ref = signal_ref if signal_ref > 0 else np.maximum(max_signal, 1e-9)
+    nref = noise_ref if noise_ref > 0 else np.maximum(noise_frac, 1e-9)
+    noise_ratio = noise_frac / nref
+
+    def _linear(value, low, high, max_points):
+        return np.clip((value - low) / (high - low), 0.0, 1.0) * max_points
+
+    magnitude_score = _linear(max_signal, 0.1 * ref, ref, 40)
+    noise_score = 30 - _linear(noise_ratio, 1.0, 3.0, 30)
+    amplitude_score = _linear(signal_range, 0.1 * ref, 0.6 * ref, 30)
+    score = np.round(np.clip(magnitude_score + noise_score + amplitude_score, 0.0, 100.0))
+
+    low_signal = max_signal < 0.15 * ref
+    noisy_baseline = noise_ratio > 2.0
+    weak_amplification = signal_range < 0.15 * ref
+
+    results = {}
+    for i, well in enumerate(wells):
+        flags: list[str] = []
+        if low_signal[i]:
+            flags.append("low_signal")
+        if noisy_baseline[i]:
+            flags.append("noisy_baseline")
+        if weak_amplification[i]:
+            flags.append("weak_amplification")
+        results[well] = {
+            "score": int(score[i]),
+            "magnitude_score": round(float(magnitude_score[i]), 1),
+            "noise_score": round(float(noise_score[i]), 1),
+            "rise_score": round(float(amplitude_score[i]), 1),
+            "flags": flags,
+            "well": well,
+        }
+    return results
@@ -1,10 +1,13 @@
 """Generate matplotlib chart images for PDF reports."""
 from __future__ import annotations
 import io
+import threading
+from contextlib import contextmanager
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import EllipseCollection
 import numpy as np
 
 
@@ -20,6 +23,45 @@ GENOTYPE_COLORS = {
 }
 
 
+# Figure/Agg-canvas construction is the dominant fixed cost of a chart render,
+# so figures are pooled per size and their axes cleared between uses instead of
+# being rebuilt. The pool caps at ~4 entries (one per chart size in practice);
+# a concurrent render of the same size simply gets a fresh throwaway figure.
+_FIG_POOL: dict[tuple[float, float], object] = {}
+_FIG_POOL_LOCK = threading.Lock()
+_FIG_POOL_MAX = 4
+
+_SUBPLOT_DEFAULTS = {
+    k: matplotlib.rcParams["figure.subplot." + k]
+    for k in ("left", "right", "bottom", "top", "wspace", "hspace")
+}
+
+
+@contextmanager
+def _borrow_fig(width: float, height: float):
+    key = (width, height)
+    with _FIG_POOL_LOCK:
+        fig = _FIG_POOL.pop(key, None)
+    if fig is None:
+        fig = plt.figure(figsize=(width, height))
+    else:
+        # tight_layout mutated the subplot params on the previous use; reset
+        # them to the rc defaults so a reused figure renders byte-identically
+        # to a fresh one.
+        fig.clf()
+        fig.subplots_adjust(**_SUBPLOT_DEFAULTS)
+    ax = fig.add_subplot(111)
+    try:
+        yield fig, ax
+    finally:
+        with _FIG_POOL_LOCK:
+            if key not in _FIG_POOL and len(_FIG_POOL) < _FIG_POOL_MAX:
+                _FIG_POOL[key] = fig
+                fig = None
+        if fig is not None:
+            plt.close(fig)
+
+
 def render_scatter_png(points: list[dict], allele2_dye: str = "VIC", width: float = 6, height: float = 4.5) -> bytes:
     """Render scatter plot as PNG bytes.
 
@@ -31,30 +73,28 @@ def render_scatter_png(points: list[dict], allele2_dye: str = "VIC", width: floa
     Returns:
         PNG image bytes
     """
-    fig, ax = plt.subplots(figsize=(width, height))
-
-    # Group by genotype for coloring
-    groups: dict[str, list] = {}
-    for p in points:
-        gt = p.get("effective_type", "Unknown")
-        groups.setdefault(gt, []).append(p)
-
-    for gt, pts in groups.items():
-        color = GENOTYPE_COLORS.get(gt, "#6b7280")
-        xs = [p["norm_allele2"] for p in pts]
-        ys = [p["norm_fam"] for p in pts]
-        ax.scatter(xs, ys, c=color, s=20, alpha=0.7, label=gt, edgecolors="white", linewidth=0.3)
-
-    ax.set_xlabel(f"{allele2_dye} (normalized)", fontsize=10)
-    ax.set_ylabel("FAM (normalized)", fontsize=10)
-    ax.set_title("Allele Discrimination Plot", fontsize=12, fontweight="bold")
-    ax.legend(fontsize=8, loc="upper right", framealpha=0.9)
-    ax.grid(True, alpha=0.3)
-
-    fig.tight_layout()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150)
-    plt.close(fig)
+    with _borrow_fig(width, height) as (fig, ax):
+        # Group by genotype for coloring
+        groups: dict[str, list] = {}
+        for p in points:
+            gt = p.get("effective_type", "Unknown")
+            groups.setdefault(gt, []).append(p)
+
+        for gt, pts in groups.items():
+            color = GENOTYPE_COLORS.get(gt, "#6b7280")
+            xs = [p["norm_allele2"] for p in pts]
+            ys = [p["norm_fam"] for p in pts]
+            ax.scatter(xs, ys, c=color, s=20, alpha=0.7, label=gt, edgecolors="white", linewidth=0.3)
+
+        ax.set_xlabel(f"{allele2_dye} (normalized)", fontsize=10)
+        ax.set_ylabel("FAM (normalized)", fontsize=10)
+        ax.set_title("Allele Discrimination Plot", fontsize=12, fontweight="bold")
+        ax.legend(fontsize=8, loc="upper right", framealpha=0.9)
+        ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=150)
     buf.seek(0)
     return buf.read()
 
@@ -68,44 +108,51 @@ def render_plate_png(wells: list[dict], width: float = 7, height: float = 4) ->
     Returns:
         PNG image bytes
     """
-    fig, ax = plt.subplots(figsize=(width, height))
-
-    # Draw plate grid
-    for r in range(8):
+    with _borrow_fig(width, height) as (fig, ax):
+        # Plate grid + filled wells as two collections (one C-level draw each)
+        # instead of up to ~192 individual Circle patches.
+        grid_offsets = np.array([[c + 0.5, 7.5 - r] for r in range(8) for c in range(12)])
+        ax.add_collection(EllipseCollection(
+            widths=0.7, heights=0.7, angles=0, units="xy",
+            offsets=grid_offsets, offset_transform=ax.transData,
+            facecolors="none", edgecolors="#d0d0d0", linewidths=0.5,
+        ))
+
+        if wells:
+            fill_offsets = np.array(
+                [[w.get("col", 0) + 0.5, 7.5 - w.get("row", 0)] for w in wells]
+            )
+            facecolors = [
+                GENOTYPE_COLORS.get(w.get("effective_type", "Unknown"), "#d0d0d0")
+                for w in wells
+            ]
+            ax.add_collection(EllipseCollection(
+                widths=0.7, heights=0.7, angles=0, units="xy",
+                offsets=fill_offsets, offset_transform=ax.transData,
+                facecolors=facecolors, edgecolors="white", linewidths=0.5, alpha=0.8,
+            ))
+
+        # Row labels
+        for r in range(8):
+            ax.text(-0.2, 7.5 - r, chr(65 + r), ha="center", va="center", fontsize=9, fontweight="bold", color="#666")
+        # Col labels
         for c in range(12):
-            ax.add_patch(plt.Circle((c + 0.5, 7.5 - r), 0.35, fill=False, edgecolor="#d0d0d0", linewidth=0.5))
-
-    # Fill wells with data
-    for w in wells:
-        row = w.get("row", 0)
-        col = w.get("col", 0)
-        gt = w.get("effective_type", "Unknown")
-        color = GENOTYPE_COLORS.get(gt, "#d0d0d0")
-        circle = plt.Circle((col + 0.5, 7.5 - row), 0.35, facecolor=color, edgecolor="white", linewidth=0.5, alpha=0.8)
-        ax.add_patch(circle)
-
-    # Row labels
-    for r in range(8):
-        ax.text(-0.2, 7.5 - r, chr(65 + r), ha="center", va="center", fontsize=9, fontweight="bold", color="#666")
-    # Col labels
-    for c in range(12):
-        ax.text(c + 0.5, 8.2, str(c + 1), ha="center", va="center", fontsize=8, color="#666")
-
-    # Legend
-    handles = []
-    for gt, color in GENOTYPE_COLORS.items():
-        handles.append(mpatches.Patch(color=color, label=gt))
-    ax.legend(handles=handles, fontsize=7, loc="lower center", bbox_to_anchor=(0.5, -0.18), ncol=4, framealpha=0.9)
-
-    ax.set_xlim(-0.5, 12.5)
-    ax.set_ylim(-0.5, 9)
-    ax.set_aspect("equal")
-    ax.axis("off")
-    ax.set_title("Plate View", fontsize=12, fontweight="bold")
-
-    fig.tight_layout()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    plt.close(fig)
+            ax.text(c + 0.5, 8.2, str(c + 1), ha="center", va="center", fontsize=8, color="#666")
+
+        # Legend
+        handles = []
+        for gt, color in GENOTYPE_COLORS.items():
+            handles.append(mpatches.Patch(color=color, label=gt))
+        ax.legend(handles=handles, fontsize=7, loc="lower center", bbox_to_anchor=(0.5, -0.18), ncol=4, framealpha=0.9)
+
+        ax.set_xlim(-0.5, 12.5)
+        ax.set_ylim(-0.5, 9)
+        ax.set_aspect("equal")
+        ax.axis("off")
+        ax.set_title("Plate View", fontsize=12, fontweight="bold")
+
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
     buf.seek(0)
     return buf.read()
@@ -1,6 +1,10 @@
 """Build PDF report using reportlab."""
 from __future__ import annotations
 import io
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 
 from reportlab.lib import colors
@@ -13,6 +17,113 @@ from reportlab.platypus import (
 
 from app.reporting.charts import render_scatter_png, render_plate_png, GENOTYPE_COLORS
 
+# The two matplotlib renders dominate build time and hold the GIL, so they run
+# in worker processes and overlap on separate cores. Created lazily: most
+# deployments never export a PDF.
+_RENDER_POOL: ProcessPoolExecutor | None = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+# Styles are immutable once built, so construct them once at import instead of
+# re-parsing the sample stylesheet and re-allocating every style per report.
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle("ReportTitle", parent=_STYLES["Heading1"], fontSize=18, spaceAfter=6)
+_SUBTITLE_STYLE = ParagraphStyle("ReportSubtitle", parent=_STYLES["Normal"], fontSize=10, textColor=colors.grey, spaceAfter=12)
+_H2_STYLE = ParagraphStyle("H2", parent=_STYLES["Heading2"], fontSize=14, spaceBefore=16, spaceAfter=8)
+_NORMAL_STYLE = _STYLES["Normal"]
+_FOOTER_STYLE = ParagraphStyle("Footer", parent=_NORMAL_STYLE, fontSize=8, textColor=colors.grey, alignment=1)
+
+_INFO_TABLE_STYLE = TableStyle([
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("TEXTCOLOR", (0, 0), (0, -1), colors.grey),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+])
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.93, 0.95, 0.97)),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.87, 0.9)),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+])
+_CT_TABLE_STYLE = TableStyle([
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.93, 0.95, 0.97)),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.87, 0.9)),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+])
+
+
+def _render_pool() -> ProcessPoolExecutor:
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        with _RENDER_POOL_LOCK:
+            if _RENDER_POOL is None:
+                _RENDER_POOL = ProcessPoolExecutor(max_workers=2)
+    return _RENDER_POOL
+
+
+# Rendered PNGs keyed by chart content, so re-exporting an unchanged session
+# skips matplotlib entirely. Hashing a plate's worth of tuples is microseconds
+# against the hundreds of ms a render costs.
+_CHART_CACHE: OrderedDict[tuple, tuple[bytes, bytes]] = OrderedDict()
+_CHART_CACHE_MAX = 8
+
+
+def _chart_key(
+    scatter_points: list[dict], allele2_dye: str, plate_wells: list[dict]
+) -> tuple:
+    return (
+        allele2_dye,
+        tuple(
+            (p["well"], p["norm_fam"], p["norm_allele2"], p.get("effective_type"))
+            for p in scatter_points
+        ),
+        tuple(
+            (w["well"], w["row"], w["col"], w.get("effective_type"))
+            for w in plate_wells
+        ),
+    )
+
+
+def _render_charts(
+    scatter_points: list[dict], allele2_dye: str, plate_wells: list[dict]
+) -> tuple[bytes, bytes]:
+    """Render the scatter and plate PNGs, in parallel when the pool is healthy.
+
+    Results are memoized by chart content: the PDF is the only server-side
+    consumer of these renders today, so the cache pays off on repeated exports
+    of the same session rather than on sharing with a preview endpoint."""
+    key = _chart_key(scatter_points, allele2_dye, plate_wells)
+    cached = _CHART_CACHE.get(key)
+    if cached is not None:
+        _CHART_CACHE.move_to_end(key)
+        return cached
+
+    pngs = _render_chart_pngs(scatter_points, allele2_dye, plate_wells)
+    _CHART_CACHE[key] = pngs
+    while len(_CHART_CACHE) > _CHART_CACHE_MAX:
+        _CHART_CACHE.popitem(last=False)
+    return pngs
+
+
+def _render_chart_pngs(
+    scatter_points: list[dict], allele2_dye: str, plate_wells: list[dict]
+) -> tuple[bytes, bytes]:
+    try:
+        pool = _render_pool()
+        scatter_future = pool.submit(render_scatter_png, scatter_points, allele2_dye)
+        plate_future = pool.submit(render_plate_png, plate_wells)
+        return scatter_future.result(), plate_future.result()
+    except BrokenProcessPool:
+        global _RENDER_POOL
+        with _RENDER_POOL_LOCK:
+            _RENDER_POOL = None
+        return render_scatter_png(scatter_points, allele2_dye), render_plate_png(plate_wells)
+
 
 def build_report(
     session_id: str,
@@ -34,20 +145,20 @@ def build_report(
         buf, pagesize=A4,
         leftMargin=15*mm, rightMargin=15*mm,
         topMargin=15*mm, bottomMargin=15*mm,
+        # The payload is dominated by the two PNGs, which are already
+        # deflate-compressed; pageCompression would re-run zlib over them for
+        # no size win, so leave it off (text/table streams stay uncompressed).
+        pageCompression=0,
     )
 
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle("ReportTitle", parent=styles["Heading1"], fontSize=18, spaceAfter=6)
-    subtitle_style = ParagraphStyle("ReportSubtitle", parent=styles["Normal"], fontSize=10, textColor=colors.grey, spaceAfter=12)
-    h2_style = ParagraphStyle("H2", parent=styles["Heading2"], fontSize=14, spaceBefore=16, spaceAfter=8)
-    normal_style = styles["Normal"]
+    scatter_png, plate_png = _render_charts(scatter_points, allele2_dye, plate_wells)
 
     elements = []
 
     # Title
-    elements.append(Paragraph("SNP Discrimination Report", title_style))
+    elements.append(Paragraph("SNP Discrimination Report", _TITLE_STYLE))
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    elements.append(Paragraph(f"Generated: {now} | Session: {session_id}", subtitle_style))
+    elements.append(Paragraph(f"Generated: {now} | Session: {session_id}", _SUBTITLE_STYLE))
 
     # Session info table
     info_data = [
@@ -60,38 +171,27 @@ def build_report(
         info_data.append(["Source File", filename])
 
     info_table = Table(info_data, colWidths=[35*mm, 80*mm])
-    info_table.setStyle(TableStyle([
-        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ("TEXTCOLOR", (0, 0), (0, -1), colors.grey),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-    ]))
+    info_table.setStyle(_INFO_TABLE_STYLE)
     elements.append(info_table)
     elements.append(Spacer(1, 12))
 
     # Scatter plot
-    elements.append(Paragraph("Allele Discrimination Plot", h2_style))
-    scatter_png = render_scatter_png(scatter_points, allele2_dye)
+    elements.append(Paragraph("Allele Discrimination Plot", _H2_STYLE))
     scatter_img = Image(io.BytesIO(scatter_png), width=160*mm, height=120*mm)
     elements.append(scatter_img)
 
     # Plate view
-    elements.append(Paragraph("Plate View", h2_style))
-    plate_png = render_plate_png(plate_wells)
+    elements.append(Paragraph("Plate View", _H2_STYLE))
     plate_img = Image(io.BytesIO(plate_png), width=170*mm, height=100*mm)
     elements.append(plate_img)
 
     # Genotype summary table
-    elements.append(Paragraph("Genotype Summary", h2_style))
-    genotype_counts: dict[str, int] = {}
-    for p in scatter_points:
-        gt = p.get("effective_type", "Unknown")
-        genotype_counts[gt] = genotype_counts.get(gt, 0) + 1
+    elements.append(Paragraph("Genotype Summary", _H2_STYLE))
+    genotype_counts = Counter(p.get("effective_type", "Unknown") for p in scatter_points)
 
     summary_data = [["Genotype", "Count", "%"]]
-    total = len(scatter_points) or 1
-    for gt in ["Allele 1 Homo", "Allele 2 Homo", "Heterozygous", "NTC", "Undetermined", "Unknown"]:
+    total = sum(genotype_counts.values()) or 1
+    for gt in ("Allele 1 Homo", "Allele 2 Homo", "Heterozygous", "NTC", "Undetermined", "Unknown"):
         count = genotype_counts.get(gt, 0)
         if count > 0:
             pct = f"{count / total * 100:.1f}"
@@ -99,45 +199,35 @@ def build_report(
 
     if len(summary_data) > 1:
         summary_table = Table(summary_data, colWidths=[50*mm, 25*mm, 25*mm])
-        summary_table.setStyle(TableStyle([
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 9),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.93, 0.95, 0.97)),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.87, 0.9)),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         elements.append(summary_table)
 
     # Ct/Cq results table (if available)
     if ct_results:
         elements.append(PageBreak())
-        elements.append(Paragraph("Ct/Cq Values", h2_style))
+        elements.append(Paragraph("Ct/Cq Values", _H2_STYLE))
         ct_data = [["Well", "FAM Ct", f"{allele2_dye} Ct"]]
-        for well in sorted(ct_results.keys(), key=lambda w: (w[0], int(w[1:]))):
+        # Decorate-sort: parse each well id once instead of O(N log N) key calls
+        well_rows = [(w[0], int(w[1:]), w) for w in ct_results]
+        well_rows.sort()
+        for _, _, well in well_rows:
             ct = ct_results[well]
             fam_ct = f"{ct['fam_ct']:.1f}" if ct.get("fam_ct") is not None else "Undet."
             a2_ct = f"{ct['allele2_ct']:.1f}" if ct.get("allele2_ct") is not None else "Undet."
             ct_data.append([well, fam_ct, a2_ct])
 
         ct_table = Table(ct_data, colWidths=[25*mm, 35*mm, 35*mm])
-        ct_table.setStyle(TableStyle([
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.93, 0.95, 0.97)),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.Color(0.85, 0.87, 0.9)),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-        ]))
+        ct_table.setStyle(_CT_TABLE_STYLE)
         elements.append(ct_table)
 
     # Footer
     elements.append(Spacer(1, 20))
     elements.append(Paragraph(
         "Report generated by ASG-PCR SNP Discrimination Analyzer | Powered by Invirustech",
-        ParagraphStyle("Footer", parent=normal_style, fontSize=8, textColor=colors.grey, alignment=1),
+        _FOOTER_STYLE,
     ))
 
     doc.build(elements)
-    buf.seek(0)
-    return buf.read()
+    # getvalue() hands back the buffer's bytes without the extra seek+read
+    # copy, so peak memory stays ~1x the PDF size on large reports.
+    return buf.getvalue()
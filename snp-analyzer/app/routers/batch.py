@@ -6,16 +6,19 @@ All endpoints require authentication; regular users see only their own projects.
 """
 from __future__ import annotations
 
-import uuid
+import asyncio
+import secrets
+from collections import Counter
 from datetime import datetime, timezone
 
+import numpy as np
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from app.auth import CurrentUser, check_project_access, check_session_access
+from app.auth import CurrentUser, check_session_access, check_sessions_access
 from app.config import is_asg_launch_mode
 from app.db import get_db
-from app.processing.genotype import count_genotypes, get_effective_types
+from app.processing.genotype import count_genotypes_from_tally, get_effective_types
 from app.processing.quality import score_all_wells
 from app.routers.clustering import cluster_store, welltype_store
 from app.routers.upload import sessions
@@ -53,35 +56,75 @@ class BulkSessionsRequest(BaseModel):
 # DB helper functions
 # ---------------------------------------------------------------------------
 
-def _get_project_or_404(project_id: str) -> dict:
-    """Load a project row from DB or raise 404."""
+# Hot SQL as module-level constants: sqlite3's per-connection statement cache
+# keys on the SQL text, so reusing the exact same string object guarantees a
+# cache hit without re-hashing a freshly built literal each call.
+_SQL_SELECT_PROJECT = "SELECT id, name, user_id, created_at FROM projects WHERE id = ?"
+_SQL_SELECT_SESSION_IDS = (
+    "SELECT session_id FROM project_sessions WHERE project_id = ? ORDER BY position"
+)
+_SQL_DELETE_PROJECT_SESSIONS = "DELETE FROM project_sessions WHERE project_id = ?"
+_SQL_INSERT_PROJECT_SESSION = (
+    "INSERT INTO project_sessions (project_id, session_id, position) VALUES (?, ?, ?)"
+)
+
+
+def _get_project_or_404(project_id: str, current_user: CurrentUser) -> dict:
+    """Load a project row and enforce ownership with a single SELECT.
+
+    check_project_access used to issue its own user_id lookup and every
+    endpoint then re-fetched the row via this helper -- two queries for the
+    same id per request. The fetched row doubles as the access check."""
     conn = get_db()
-    row = conn.execute("SELECT id, name, user_id, created_at FROM projects WHERE id = ?", (project_id,)).fetchone()
+    row = conn.execute(_SQL_SELECT_PROJECT, (project_id,)).fetchone()
     if not row:
         raise HTTPException(404, "Project not found")
+    _check_project_row_access(row, current_user)
     return dict(row)
 
 
+def _check_project_row_access(row, user) -> None:
+    """Same ownership rule as app.auth.check_project_access, applied to an
+    already-fetched projects row."""
+    if user.role == "admin" and not is_asg_launch_mode():
+        return
+    if row["user_id"] != user.user_id:
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+
+
 def _get_session_ids(project_id: str) -> list[str]:
     """Get ordered session_ids for a project."""
     conn = get_db()
-    rows = conn.execute(
-        "SELECT session_id FROM project_sessions WHERE project_id = ? ORDER BY position",
-        (project_id,),
-    ).fetchall()
+    rows = conn.execute(_SQL_SELECT_SESSION_IDS, (project_id,)).fetchall()
     return [r["session_id"] for r in rows]
 
 
 def _set_session_ids(project_id: str, session_ids: list[str]) -> None:
     """Replace all project_sessions for a project with the given ordered list."""
     conn = get_db()
-    conn.execute("DELETE FROM project_sessions WHERE project_id = ?", (project_id,))
-    for pos, sid in enumerate(session_ids):
-        conn.execute(
-            "INSERT INTO project_sessions (project_id, session_id, position) VALUES (?, ?, ?)",
-            (project_id, sid, pos),
+    # Single transaction (one fsync) with one prepared INSERT dispatched via
+    # executemany instead of a Python-level execute per row
+    with conn:
+        conn.execute(_SQL_DELETE_PROJECT_SESSIONS, (project_id,))
+        conn.executemany(
+            _SQL_INSERT_PROJECT_SESSION,
+            [(project_id, sid, pos) for pos, sid in enumerate(session_ids)],
         )
-    conn.commit()
+
+
+def _get_sessions_with_filenames(project_id: str) -> list[tuple[str, str]]:
+    """Ordered (session_id, raw_filename) pairs for a project in one query.
+
+    Joins project_sessions to sessions so callers that need both (the summary
+    endpoint) skip the separate _get_session_ids + _get_raw_filenames pair."""
+    conn = get_db()
+    rows = conn.execute(
+        "SELECT ps.session_id, s.raw_filename FROM project_sessions ps "
+        "LEFT JOIN sessions s ON s.session_id = ps.session_id "
+        "WHERE ps.project_id = ? ORDER BY ps.position",
+        (project_id,),
+    ).fetchall()
+    return [(r["session_id"], r["raw_filename"] or "") for r in rows]
 
 
 def _get_raw_filenames(sids_list: list[str]) -> dict[str, str]:
@@ -101,7 +144,7 @@ def _validate_project_session_ids(session_ids: list[str], current_user: CurrentU
     for sid in session_ids:
         if sid not in sessions:
             raise HTTPException(404, "Session not found")
-        check_session_access(sid, current_user)
+    check_sessions_access(session_ids, current_user)
 
 
 # ---------------------------------------------------------------------------
@@ -122,17 +165,29 @@ async def list_projects(current_user: CurrentUser):
             (current_user.user_id,),
         ).fetchall()
 
-    projects = []
-    for r in rows:
-        count = conn.execute(
-            "SELECT COUNT(*) as cnt FROM project_sessions WHERE project_id = ?", (r["id"],)
-        ).fetchone()["cnt"]
-        projects.append({
+    # One grouped query for all membership counts instead of a COUNT(*) per
+    # project (classic N+1)
+    counts: dict[str, int] = {}
+    if rows:
+        placeholders = ",".join("?" * len(rows))
+        counts = {
+            r["project_id"]: r["cnt"]
+            for r in conn.execute(
+                f"SELECT project_id, COUNT(*) as cnt FROM project_sessions "
+                f"WHERE project_id IN ({placeholders}) GROUP BY project_id",
+                [r["id"] for r in rows],
+            )
+        }
+
+    projects = [
+        {
             "id": r["id"],
             "name": r["name"],
             "created_at": r["created_at"],
-            "session_count": count,
-        })
+            "session_count": counts.get(r["id"], 0),
+        }
+        for r in rows
+    ]
 
     return {"projects": projects}
 
@@ -141,7 +196,9 @@ async def list_projects(current_user: CurrentUser):
 async def create_project(body: ProjectCreate, current_user: CurrentUser):
     """Create a new project with auto-generated id and timestamp."""
     conn = get_db()
-    project_id = uuid.uuid4().hex[:12]
+    # Same 12 hex chars / 48 bits as the old uuid4().hex[:12] slice, without
+    # building and formatting a UUID object first
+    project_id = secrets.token_hex(6)
     created_at = datetime.now(timezone.utc).isoformat()
 
     if body.session_ids:
@@ -168,22 +225,40 @@ async def create_project(body: ProjectCreate, current_user: CurrentUser):
 @router.get("/api/projects/{project_id}")
 async def get_project(project_id: str, current_user: CurrentUser):
     """Get project detail with per-session summary info."""
-    check_project_access(project_id, current_user)
-    project = _get_project_or_404(project_id)
-    sids_list = _get_session_ids(project_id)
-    db_info = _get_raw_filenames(sids_list)
+    # Project row, ordered membership and raw filenames in one statement
+    # instead of three sequential queries; the first row doubles as the
+    # ownership check
+    conn = get_db()
+    rows = conn.execute(
+        "SELECT p.id, p.name, p.user_id, p.created_at, ps.session_id, s.raw_filename "
+        "FROM projects p "
+        "LEFT JOIN project_sessions ps ON ps.project_id = p.id "
+        "LEFT JOIN sessions s ON s.session_id = ps.session_id "
+        "WHERE p.id = ? ORDER BY ps.position",
+        (project_id,),
+    ).fetchall()
+    if not rows:
+        raise HTTPException(404, "Project not found")
+    project = rows[0]
+    _check_project_row_access(project, current_user)
 
     # Build per-session summaries (only for sessions that still exist in memory)
+    sids_list = []
     session_summaries = []
-    for sid in sids_list:
-        if sid in sessions:
-            unified = sessions[sid]
+    for r in rows:
+        sid = r["session_id"]
+        if sid is None:  # project with no sessions: LEFT JOIN padding row
+            continue
+        sids_list.append(sid)
+        raw_filename = r["raw_filename"] or ""
+        unified = sessions.get(sid)
+        if unified is not None:
             session_summaries.append({
                 "session_id": sid,
                 "instrument": unified.instrument,
                 "num_wells": len(unified.wells),
                 "num_cycles": len(unified.cycles),
-                "raw_filename": db_info.get(sid, ""),
+                "raw_filename": raw_filename,
             })
         else:
             session_summaries.append({
@@ -191,7 +266,7 @@ async def get_project(project_id: str, current_user: CurrentUser):
                 "instrument": "unknown",
                 "num_wells": 0,
                 "num_cycles": 0,
-                "raw_filename": db_info.get(sid, ""),
+                "raw_filename": raw_filename,
                 "missing": True,
             })
 
@@ -208,8 +283,7 @@ async def get_project(project_id: str, current_user: CurrentUser):
 @router.put("/api/projects/{project_id}")
 async def update_project(project_id: str, body: ProjectUpdate, current_user: CurrentUser):
     """Update project name and/or session_ids."""
-    check_project_access(project_id, current_user)
-    project = _get_project_or_404(project_id)
+    project = _get_project_or_404(project_id, current_user)
 
     conn = get_db()
     if body.name is not None:
@@ -234,8 +308,7 @@ async def update_project(project_id: str, body: ProjectUpdate, current_user: Cur
 @router.delete("/api/projects/{project_id}")
 async def delete_project(project_id: str, current_user: CurrentUser):
     """Delete a project (CASCADE removes project_sessions rows)."""
-    check_project_access(project_id, current_user)
-    _get_project_or_404(project_id)  # raises 404 if not found
+    _get_project_or_404(project_id, current_user)
 
     conn = get_db()
     conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
@@ -250,16 +323,14 @@ async def delete_project(project_id: str, current_user: CurrentUser):
 @router.post("/api/projects/{project_id}/sessions/bulk-add")
 async def bulk_add_sessions_to_project(project_id: str, body: BulkSessionsRequest, current_user: CurrentUser):
     """Add multiple sessions to a project at once."""
-    check_project_access(project_id, current_user)
-    _get_project_or_404(project_id)
+    _get_project_or_404(project_id, current_user)
 
     sids = _get_session_ids(project_id)
     existing = set(sids)
+    candidates = [sid for sid in body.session_ids if sid in sessions]
+    check_sessions_access(candidates, current_user)
     added = []
-    for sid in body.session_ids:
-        if sid not in sessions:
-            continue  # skip missing sessions silently
-        check_session_access(sid, current_user)
+    for sid in candidates:
         if sid not in existing:
             sids.append(sid)
             existing.add(sid)
@@ -272,8 +343,7 @@ async def bulk_add_sessions_to_project(project_id: str, body: BulkSessionsReques
 @router.post("/api/projects/{project_id}/sessions/bulk-remove")
 async def bulk_remove_sessions_from_project(project_id: str, body: BulkSessionsRequest, current_user: CurrentUser):
     """Remove multiple sessions from a project at once."""
-    check_project_access(project_id, current_user)
-    _get_project_or_404(project_id)
+    _get_project_or_404(project_id, current_user)
 
     remove_set = set(body.session_ids)
     old_sids = _get_session_ids(project_id)
@@ -291,51 +361,122 @@ async def add_session_to_project(project_id: str, sid: str, current_user: Curren
         raise HTTPException(404, "Session not found")
     check_session_access(sid, current_user)
 
-    check_project_access(project_id, current_user)
-    _get_project_or_404(project_id)
+    _get_project_or_404(project_id, current_user)
 
-    sids = _get_session_ids(project_id)
-    if sid in sids:
+    # Targeted INSERT instead of load-list + membership scan + full rewrite;
+    # the (project_id, session_id) primary key makes the duplicate check O(1)
+    conn = get_db()
+    with conn:
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO project_sessions (project_id, session_id, position) "
+            "VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 "
+            "FROM project_sessions WHERE project_id = ?))",
+            (project_id, sid, project_id),
+        )
+    if cur.rowcount == 0:
         raise HTTPException(400, "Session already in project")
-    sids.append(sid)
-
-    _set_session_ids(project_id, sids)
-    return {"status": "ok", "session_ids": sids}
+    return {"status": "ok", "session_ids": _get_session_ids(project_id)}
 
 
 @router.delete("/api/projects/{project_id}/sessions/{sid}")
 async def remove_session_from_project(project_id: str, sid: str, current_user: CurrentUser):
     """Remove a session from a project."""
-    check_project_access(project_id, current_user)
-    _get_project_or_404(project_id)
+    _get_project_or_404(project_id, current_user)
 
-    sids = _get_session_ids(project_id)
-    if sid not in sids:
+    conn = get_db()
+    with conn:
+        cur = conn.execute(
+            "DELETE FROM project_sessions WHERE project_id = ? AND session_id = ?",
+            (project_id, sid),
+        )
+    if cur.rowcount == 0:
         raise HTTPException(404, "Session not in project")
-    sids.remove(sid)
-
-    _set_session_ids(project_id, sids)
-    return {"status": "ok", "session_ids": sids}
+    return {"status": "ok", "session_ids": _get_session_ids(project_id)}
 
 
 # ---------------------------------------------------------------------------
 # Batch summary endpoint
 # ---------------------------------------------------------------------------
 
+# sid -> (unified, cluster snapshot, manual snapshot, effective, summary fields).
+# score_all_wells dominates summary cost; the stores are plain dicts mutated in
+# place across routers, so instead of revision counters the cache keeps
+# assignment snapshots and compares them on lookup (an O(wells) dict compare vs.
+# re-scoring the whole plate). Dashboard polling then reuses the previous result
+# until the session data or an assignment actually changes.
+_summary_cache: dict[str, tuple] = {}
+
+
+def _session_summary(sid: str, unified) -> tuple[dict[str, str], dict]:
+    """Effective types and summary fields for one session, memoized."""
+    cluster_assignments = {}
+    if sid in cluster_store:
+        cluster_assignments = cluster_store[sid].assignments
+    manual_assignments = welltype_store.get(sid, {})
+
+    cached = _summary_cache.get(sid)
+    if (
+        cached is not None
+        and cached[0] is unified
+        and cached[1] == cluster_assignments
+        and cached[2] == manual_assignments
+    ):
+        return cached[3], cached[4]
+
+    effective = get_effective_types(
+        cluster_assignments, manual_assignments, unified.wells
+    )
+    tally = Counter(effective.values())
+
+    try:
+        quality_scores = score_all_wells(unified, use_rox=unified.has_rox)
+        scores = np.fromiter(
+            (v["score"] for v in quality_scores.values()),
+            dtype=np.float64,
+            count=len(quality_scores),
+        )
+        mean_quality = round(float(scores.mean()), 1) if scores.size else 0.0
+    except Exception:
+        mean_quality = 0.0
+
+    fields = {
+        "instrument": unified.instrument,
+        "num_wells": len(unified.wells),
+        "genotypes": count_genotypes_from_tally(tally),
+        "ntc_count": tally.get("NTC", 0),
+        "unknown_count": tally.get("Unknown", 0) + tally.get("Undetermined", 0),
+        "mean_quality": mean_quality,
+    }
+    _summary_cache[sid] = (
+        unified, dict(cluster_assignments), dict(manual_assignments), effective, fields,
+    )
+    return effective, fields
+
+
 @router.get("/api/projects/{project_id}/summary")
 async def project_summary(project_id: str, current_user: CurrentUser):
     """Batch summary: per-plate genotype counts, quality scores, cross-plate concordance."""
-    check_project_access(project_id, current_user)
-    project = _get_project_or_404(project_id)
-    sids_list = _get_session_ids(project_id)
-    db_info = _get_raw_filenames(sids_list)
+    project = _get_project_or_404(project_id, current_user)
+    session_rows = _get_sessions_with_filenames(project_id)
 
     plate_summaries: list[dict] = []
-    # For concordance: well_id -> list of genotypes across plates
-    well_genotypes: dict[str, list[str]] = {}
-
-    for sid in sids_list:
-        if sid not in sessions:
+    # Project-wide genotype totals, accumulated inline so the frontend does not
+    # need a second pass over the plates
+    total_counts: Counter[str] = Counter()
+    # Streaming concordance tally: the first genotype seen per well, the wells
+    # seen on 2+ plates, and those with any disagreement. Avoids materializing
+    # a per-well list of genotypes across all plates just to set-compare it.
+    first_gt: dict[str, str] = {}
+    seen_multi: set[str] = set()
+    discordant: set[str] = set()
+
+    # Missing plates get their stub inline; present plates are scored in
+    # worker threads concurrently (score_all_wells is the CPU-heavy part and
+    # its numpy kernels release the GIL), keeping the event loop free.
+    pending = []  # (slot in plate_summaries, sid, raw_filename, unified)
+    for sid, raw_filename in session_rows:
+        unified = sessions.get(sid)
+        if unified is None:
             plate_summaries.append({
                 "session_id": sid,
                 "instrument": "unknown",
@@ -344,65 +485,46 @@ async def project_summary(project_id: str, current_user: CurrentUser):
                 "ntc_count": 0,
                 "unknown_count": 0,
                 "mean_quality": 0.0,
-                "raw_filename": db_info.get(sid, ""),
+                "raw_filename": raw_filename,
                 "missing": True,
             })
             continue
+        pending.append((len(plate_summaries), sid, raw_filename, unified))
+        plate_summaries.append(None)  # filled below, keeps plate order
+
+    computed = await asyncio.gather(
+        *[
+            asyncio.to_thread(_session_summary, sid, unified)
+            for _, sid, _, unified in pending
+        ]
+    )
 
-        unified = sessions[sid]
-
-        # Get effective genotype assignments
-        cluster_assignments = {}
-        if sid in cluster_store:
-            cluster_assignments = cluster_store[sid].assignments
-        manual_assignments = welltype_store.get(sid, {})
-        effective = get_effective_types(
-            cluster_assignments, manual_assignments, unified.wells
-        )
-
-        # Count genotypes
-        counts = count_genotypes(effective)
-
-        # Count NTC and Unknown separately
-        ntc_count = sum(1 for gt in effective.values() if gt == "NTC")
-        unknown_count = sum(
-            1 for gt in effective.values() if gt in ("Unknown", "Undetermined")
-        )
-
-        # Quality scores
-        try:
-            quality_scores = score_all_wells(unified, use_rox=unified.has_rox)
-            scores = [v["score"] for v in quality_scores.values()]
-            mean_quality = round(sum(scores) / len(scores), 1) if scores else 0.0
-        except Exception:
-            mean_quality = 0.0
-
-        plate_summaries.append({
+    for (slot, sid, raw_filename, _), (effective, fields) in zip(pending, computed):
+        total_counts.update(fields["genotypes"])
+        plate_summaries[slot] = {
             "session_id": sid,
-            "instrument": unified.instrument,
-            "num_wells": len(unified.wells),
-            "genotypes": counts,
-            "ntc_count": ntc_count,
-            "unknown_count": unknown_count,
-            "mean_quality": mean_quality,
-            "raw_filename": db_info.get(sid, ""),
-        })
-
-        # Collect genotypes per well for concordance
+            **fields,
+            "raw_filename": raw_filename,
+        }
+
+        # Collect genotypes per well for concordance (plate order preserved)
         for well, gt in effective.items():
-            well_genotypes.setdefault(well, []).append(gt)
-
-    # Calculate concordance: for wells present in 2+ sessions,
-    # what % have the same genotype across all appearances
-    concordant = 0
-    total_compared = 0
-    for well, gts in well_genotypes.items():
-        if len(gts) < 2:
-            continue
-        total_compared += 1
-        # All genotypes for this well are the same
-        if len(set(gts)) == 1:
-            concordant += 1
+            prev = first_gt.get(well)
+            if prev is None:
+                first_gt[well] = gt
+            else:
+                seen_multi.add(well)
+                if gt != prev:
+                    discordant.add(well)
+
+    # Drop cache entries for sessions that no longer exist
+    for stale in _summary_cache.keys() - sessions.keys():
+        del _summary_cache[stale]
+
+    # Concordance: for wells present in 2+ sessions, what % have the same
+    # genotype across all appearances
+    total_compared = len(seen_multi)
+    concordant = total_compared - len(discordant)
 
     concordance_pct = (
         round(concordant / total_compared * 100, 1) if total_compared > 0 else None
@@ -412,6 +534,7 @@ async def project_summary(project_id: str, current_user: CurrentUser):
         "project_id": project_id,
         "project_name": project["name"],
         "plates": plate_summaries,
+        "aggregate": dict(total_counts),
         "concordance": {
             "concordant_wells": concordant,
             "total_compared": total_compared,
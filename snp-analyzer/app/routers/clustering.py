@@ -1,6 +1,6 @@
 import hashlib
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 
 from pydantic import BaseModel as _BaseModel
 
@@ -67,9 +67,10 @@ marker_store: dict[str, list[MarkerRegion]] = {}  # sid -> [MarkerRegion, ...]
 
 
 def _get_session(sid: str):
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 def _cluster_point_dicts(
@@ -292,8 +293,19 @@ def _run_regions(req, unified, cycle, point_dicts, control_wells) -> ClusteringR
     )
 
 
+# sid -> (data identity, ploidy, cycle, request json, welltype snapshot,
+# marker snapshot, result). Re-clustering with unchanged inputs is common
+# while the user tunes around a cycle (tab switches, page reloads); the cache
+# skips the whole normalize+cluster pipeline when every input matches. The
+# stores mutate in place, so validation compares snapshots, mirroring the
+# batch summary cache.
+_cluster_cache: dict[str, tuple] = {}
+
+
 @router.post("/api/data/{sid}/cluster")
-async def run_clustering(sid: str, req: ClusteringRequest, current_user: CurrentUser):
+async def run_clustering(
+    sid: str, req: ClusteringRequest, background_tasks: BackgroundTasks, current_user: CurrentUser
+):
     check_session_access(sid, current_user)
     unified = _get_session(sid)
 
@@ -301,6 +313,27 @@ async def run_clustering(sid: str, req: ClusteringRequest, current_user: Current
     if cycle not in unified.cycles:
         raise HTTPException(400, f"Cycle {cycle} not available")
 
+    req_json = req.model_dump_json()
+    welltypes = dict(welltype_store.get(sid, {}))
+    markers = list(marker_store.get(sid) or [])
+    cached = _cluster_cache.get(sid)
+    if (
+        cached is not None
+        and cached[0] is unified.data
+        and cached[1] == getattr(unified, "ploidy", 2)
+        and cached[2] == cycle
+        and cached[3] == req_json
+        and cached[4] == welltypes
+        and cached[5] == markers
+    ):
+        result = cached[6]
+        # Keep store + DB in sync even on a hit (an intervening invalidation
+        # may have cleared them); both writes are cheap next to re-clustering.
+        cluster_store[sid] = result
+        from app.db import save_clustering
+        background_tasks.add_task(save_clustering, sid, result)
+        return result.model_dump(exclude_none=True)
+
     points = normalize_for_cycle(unified, cycle)
     # Wells manually marked as "Omit" have data but should not skew clustering
     # (bad/spiked readings would drag kmeans centroids or threshold ratios).
@@ -378,9 +411,15 @@ async def run_clustering(sid: str, req: ClusteringRequest, current_user: Current
         )
 
     cluster_store[sid] = result
+    _cluster_cache[sid] = (
+        unified.data, getattr(unified, "ploidy", 2), cycle, req_json,
+        welltypes, markers, result,
+    )
 
+    # Persist after the response is sent: the in-memory store is already
+    # authoritative, so the client need not wait on the SQLite fsync.
     from app.db import save_clustering
-    save_clustering(sid, result)
+    background_tasks.add_task(save_clustering, sid, result)
 
     # Omit None fields (e.g. regions/warnings on the legacy single-marker
     # path) so a clean response doesn't grow keys that were never part of
@@ -422,19 +461,22 @@ async def get_clustering(sid: str, current_user: CurrentUser):
 
 
 @router.post("/api/data/{sid}/welltypes")
-async def set_well_types(sid: str, update: ManualWellTypeUpdate, current_user: CurrentUser):
+async def set_well_types(
+    sid: str, update: ManualWellTypeUpdate, background_tasks: BackgroundTasks, current_user: CurrentUser
+):
     check_session_access(sid, current_user)
     _get_session(sid)
-    if sid not in welltype_store:
-        welltype_store[sid] = {}
-    for well in update.wells:
-        welltype_store[sid][well] = update.well_type.value
+    # Build the well -> type mapping once; it feeds both the in-memory store
+    # update and the bulk DB write, instead of walking update.wells twice
+    value = update.well_type.value
+    changes = {well: value for well in update.wells}
+    store = welltype_store.setdefault(sid, {})
+    store.update(changes)
 
-    from app.db import save_welltype
-    for well in update.wells:
-        save_welltype(sid, well, update.well_type.value)
+    from app.db import save_welltypes_bulk
+    background_tasks.add_task(save_welltypes_bulk, sid, changes)
 
-    return {"status": "ok", "assignments": welltype_store[sid]}
+    return {"status": "ok", "assignments": store}
 
 
 @router.get("/api/data/{sid}/welltypes")
@@ -457,16 +499,16 @@ async def clear_well_types(sid: str, current_user: CurrentUser):
 
 
 @router.put("/api/data/{sid}/welltypes/bulk")
-async def bulk_replace_well_types(sid: str, body: BulkWellTypeReplace, current_user: CurrentUser):
+async def bulk_replace_well_types(
+    sid: str, body: BulkWellTypeReplace, background_tasks: BackgroundTasks, current_user: CurrentUser
+):
     """Replace all manual welltypes with the given snapshot (for undo/redo)."""
     check_session_access(sid, current_user)
     _get_session(sid)
     welltype_store[sid] = dict(body.assignments)
 
-    from app.db import delete_welltypes, save_welltype
-    delete_welltypes(sid)
-    for well, wtype in body.assignments.items():
-        save_welltype(sid, well, wtype)
+    from app.db import replace_welltypes
+    background_tasks.add_task(replace_welltypes, sid, dict(body.assignments))
 
     return {"status": "ok", "assignments": welltype_store[sid]}
 
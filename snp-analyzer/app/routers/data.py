@@ -1,8 +1,7 @@
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
 
 from app.models import (
-    ScatterPoint,
-    PlateWell,
     AmplificationCurve,
     ProtocolStep,
     UnifiedData,
@@ -18,20 +17,23 @@ router = APIRouter()
 # Protocol store: session_id -> list[ProtocolStep]
 protocol_store: dict[str, list[ProtocolStep]] = {}
 
-DEFAULT_PROTOCOL = [
+# Immutable container: the endpoint hands this shared default straight to the
+# serializer, so guard against accidental append/remove by any caller.
+DEFAULT_PROTOCOL: tuple[ProtocolStep, ...] = (
     ProtocolStep(step=1, temperature=94.0, duration_sec=900, cycles=1, label="Initial Denaturation"),
     ProtocolStep(step=2, temperature=94.0, duration_sec=20, cycles=10, label="Denaturation (Touchdown)"),
     ProtocolStep(step=3, temperature=61.0, duration_sec=60, cycles=10, label="Annealing (Touchdown -0.6/cycle)"),
     ProtocolStep(step=4, temperature=94.0, duration_sec=20, cycles=25, label="Denaturation"),
     ProtocolStep(step=5, temperature=55.0, duration_sec=60, cycles=25, label="Annealing"),
     ProtocolStep(step=6, temperature=37.0, duration_sec=60, cycles=1, label="Final Read"),
-]
+)
 
 
 def _get_session(sid: str) -> UnifiedData:
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 @router.get("/api/data/{sid}/suggest-cycle")
@@ -63,24 +65,32 @@ async def scatter_data(sid: str, current_user: CurrentUser, cycle: int = Query(d
         cluster_assignments = cluster_store[sid].assignments
         confidences = cluster_store[sid].confidences or {}
     manual_assignments = welltype_store.get(sid, {})
-
+    sample_names = unified.sample_names or {}
+
+    # Plain dicts with the ScatterPoint field set: skips per-well pydantic
+    # validation plus FastAPI's model re-serialization on the response.
+    # Bind the .get methods once instead of resolving them per point.
+    get_sample = sample_names.get
+    get_auto = cluster_assignments.get
+    get_manual = manual_assignments.get
+    get_conf = confidences.get
     return {
         "cycle": cycle,
         "allele2_dye": unified.allele2_dye,
         **build_role_label_metadata(unified),
         "points": [
-            ScatterPoint(
-                well=p.well,
-                norm_fam=p.norm_fam,
-                norm_allele2=p.norm_allele2,
-                raw_fam=p.raw_fam,
-                raw_allele2=p.raw_allele2,
-                raw_rox=p.raw_rox,
-                sample_name=(unified.sample_names or {}).get(p.well),
-                auto_cluster=cluster_assignments.get(p.well),
-                manual_type=manual_assignments.get(p.well),
-                confidence=confidences.get(p.well),
-            )
+            {
+                "well": p.well,
+                "norm_fam": p.norm_fam,
+                "norm_allele2": p.norm_allele2,
+                "raw_fam": p.raw_fam,
+                "raw_allele2": p.raw_allele2,
+                "raw_rox": p.raw_rox,
+                "sample_name": get_sample(p.well),
+                "auto_cluster": get_auto(p.well),
+                "manual_type": get_manual(p.well),
+                "confidence": get_conf(p.well),
+            }
             for p in points
         ],
     }
@@ -103,25 +113,36 @@ async def plate_data(sid: str, current_user: CurrentUser, cycle: int = Query(def
         confidences_plate = cluster_store[sid].confidences or {}
     manual_assignments_plate = welltype_store.get(sid, {})
 
+    sample_names = unified.sample_names or {}
+
+    # Vectorize the FAM-fraction ratio over the whole plate (SoA arrays fed
+    # through one where/divide pass), then emit PlateWell-shaped dicts
+    # directly -- same rationale as the scatter endpoints, the response is a
+    # plain dict so per-well pydantic validation is wasted work
+    n = len(points)
+    nf = np.fromiter((p.norm_fam for p in points), dtype=np.float64, count=n)
+    na = np.fromiter((p.norm_allele2 for p in points), dtype=np.float64, count=n)
+    total = nf + na
+    ratios = np.where(total > 0, np.divide(nf, total, out=np.full(n, 0.5), where=total > 0), 0.5)
+    ratios = np.round(ratios, 4).tolist()
+
+    well_index = unified.get_well_index()
     wells = []
-    for p in points:
-        row = ord(p.well[0]) - ord("A")
-        col = int(p.well[1:]) - 1
-        total = p.norm_fam + p.norm_allele2
-        ratio = p.norm_fam / total if total > 0 else 0.5
+    for i, p in enumerate(points):
+        row, col = well_index[p.well]
         wells.append(
-            PlateWell(
-                well=p.well,
-                row=row,
-                col=col,
-                norm_fam=p.norm_fam,
-                norm_allele2=p.norm_allele2,
-                ratio=round(ratio, 4),
-                sample_name=(unified.sample_names or {}).get(p.well),
-                auto_cluster=cluster_assignments_plate.get(p.well),
-                manual_type=manual_assignments_plate.get(p.well),
-                confidence=confidences_plate.get(p.well),
-            )
+            {
+                "well": p.well,
+                "row": row,
+                "col": col,
+                "norm_fam": p.norm_fam,
+                "norm_allele2": p.norm_allele2,
+                "ratio": ratios[i],
+                "sample_name": sample_names.get(p.well),
+                "auto_cluster": cluster_assignments_plate.get(p.well),
+                "manual_type": manual_assignments_plate.get(p.well),
+                "confidence": confidences_plate.get(p.well),
+            }
         )
 
     return {
@@ -145,13 +166,19 @@ async def amplification_data(
 
     all_normalized = normalize(unified, use_rox=use_rox)
 
+    # One pass grouping the requested wells (amplification_all's pattern)
+    # instead of rescanning every point per requested well
+    well_set = set(well_list)
+    grouped: dict[str, list] = {}
+    for p in all_normalized:
+        if p.well in well_set:
+            grouped.setdefault(p.well, []).append(p)
+
     curves = []
     for well in well_list:
-        well_points = sorted(
-            [p for p in all_normalized if p.well == well],
-            key=lambda p: p.cycle,
-        )
+        well_points = grouped.get(well)
         if well_points:
+            well_points.sort(key=lambda p: p.cycle)
             curves.append(
                 AmplificationCurve(
                     well=well,
@@ -242,6 +269,7 @@ async def export_pdf(sid: str, current_user: CurrentUser, use_rox: bool = Query(
 
     scatter_points = []
     plate_wells = []
+    well_index = unified.get_well_index()
     for p in points:
         auto_type = cluster_assignments.assignments.get(p.well) if cluster_assignments else None
         manual_type = manual_assignments.get(p.well)
@@ -254,8 +282,7 @@ async def export_pdf(sid: str, current_user: CurrentUser, use_rox: bool = Query(
             "effective_type": effective_type,
         })
 
-        row = ord(p.well[0]) - ord("A")
-        col = int(p.well[1:]) - 1
+        row, col = well_index[p.well]
         plate_wells.append({
             "well": p.well,
             "row": row,
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import csv
-import io
-
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
@@ -21,9 +18,10 @@ _UNDETERMINED_FRAC = 0.2
 
 
 def _get_session(sid: str) -> UnifiedData:
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 def _determine_genotype(
@@ -53,6 +51,13 @@ def _determine_genotype(
     return label_by_ratio(norm_fam / total, ploidy)
 
 
+def _csv_field(value: str) -> str:
+    """Quote a CSV field only when it actually needs escaping."""
+    if '"' in value or "," in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 def _undetermined_min(points) -> float:
     """Scale-relative low-signal cutoff = a fraction of the plate median total."""
     totals = [p.norm_fam + p.norm_allele2 for p in points]
@@ -108,10 +113,6 @@ async def export_csv(
                 well_marker[w] = r.name
                 well_ploidy[w] = r.ploidy
 
-    # Build CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
     # Header row (a "Marker" column is only added for a multi-marker plate)
     header: list[str] = ["Well"]
     if regions:
@@ -126,40 +127,61 @@ async def export_csv(
         f"{unified.allele2_dye} (raw)",
         "ROX (raw)",
     ]
-    writer.writerow(header)
 
-    # Data rows (sorted by well for consistent output)
+    # Sorted by well for consistent output; the session's memoized (row, col)
+    # index replaces re-parsing each well string on every export
+    well_index = unified.get_well_index()
+    sorted_points = sorted(points, key=lambda pt: well_index[pt.well])
     plate_ploidy = getattr(unified, "ploidy", 2)
     umin = _undetermined_min(points)
-    for p in sorted(points, key=lambda pt: (pt.well[0], int(pt.well[1:]))):
-        ploidy = well_ploidy.get(p.well, plate_ploidy)
-        genotype = _determine_genotype(
-            p.well, p.norm_fam, p.norm_allele2,
-            cluster_assignments, manual_assignments, ploidy, umin,
-        )
-        conf = confidences.get(p.well)
-        row: list[object] = [p.well]
-        if regions:
-            row.append(well_marker.get(p.well, ""))
-        row += [
-            sample_names.get(p.well, ""),
-            genotype,
-            round(conf * 100, 1) if conf is not None else "",
-            round(p.norm_fam, 6),
-            round(p.norm_allele2, 6),
-            round(p.raw_fam, 4),
-            round(p.raw_allele2, 4),
-            round(p.raw_rox, 4) if p.raw_rox is not None else "",
-        ]
-        writer.writerow(row)
 
-    csv_content = output.getvalue()
-    output.close()
+    # One merged call map (manual overrides auto) -> one lookup per well in
+    # the row loop; _determine_genotype is only consulted for its ratio
+    # fallback on wells with no call at all
+    effective_calls = cluster_assignments | manual_assignments
+    no_calls: dict[str, str] = {}
+
+    def generate_rows():
+        # Streamed join-based formatting: well IDs, numbers and genotype
+        # labels never need CSV escaping, so only the free-text fields go
+        # through _csv_field. str(round(...)) and the \r\n terminator keep
+        # the output byte-identical to the csv.writer it replaces.
+        lines = [",".join(_csv_field(h) for h in header)]
+        for p in sorted_points:
+            genotype = effective_calls.get(p.well)
+            if genotype is None:
+                ploidy = well_ploidy.get(p.well, plate_ploidy)
+                genotype = _determine_genotype(
+                    p.well, p.norm_fam, p.norm_allele2,
+                    no_calls, no_calls, ploidy, umin,
+                )
+            conf = confidences.get(p.well)
+            cells = [p.well]
+            if regions:
+                cells.append(_csv_field(well_marker.get(p.well, "")))
+            cells += [
+                _csv_field(str(sample_names.get(p.well, ""))),
+                _csv_field(genotype),
+                str(round(conf * 100, 1)) if conf is not None else "",
+                str(round(p.norm_fam, 6)),
+                str(round(p.norm_allele2, 6)),
+                str(round(p.raw_fam, 4)),
+                str(round(p.raw_allele2, 4)),
+                str(round(p.raw_rox, 4)) if p.raw_rox is not None else "",
+            ]
+            lines.append(",".join(cells))
+            # Flush in row batches; one yield per row would cost more in
+            # ASGI send round-trips than it saves at plate scale
+            if len(lines) >= 256:
+                yield "\r\n".join(lines) + "\r\n"
+                lines = []
+        if lines:
+            yield "\r\n".join(lines) + "\r\n"
 
     filename = f"snp_export_cycle{cycle}.csv"
 
     return StreamingResponse(
-        iter([csv_content]),
+        generate_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -215,11 +237,16 @@ async def export_xlsx(sid: str, current_user: CurrentUser, use_rox: bool = Query
     scatter_points: list[dict] = []
     table_rows: list[list] = []
     umin = _undetermined_min(points)
-    for p in sorted(points, key=lambda pt: (pt.well[0], int(pt.well[1:]))):
-        well_gt_ploidy = well_ploidy.get(p.well, ploidy)
-        gt = _determine_genotype(
-            p.well, p.norm_fam, p.norm_allele2, cluster_assignments, manual_assignments, well_gt_ploidy, umin
-        )
+    effective_calls = cluster_assignments | manual_assignments
+    no_calls: dict[str, str] = {}
+    well_index = unified.get_well_index()
+    for p in sorted(points, key=lambda pt: well_index[pt.well]):
+        gt = effective_calls.get(p.well)
+        if gt is None:
+            well_gt_ploidy = well_ploidy.get(p.well, ploidy)
+            gt = _determine_genotype(
+                p.well, p.norm_fam, p.norm_allele2, no_calls, no_calls, well_gt_ploidy, umin
+            )
         scatter_points.append({
             "well": p.well,
             "norm_fam": p.norm_fam,
@@ -55,9 +55,10 @@ class LayoutApply(BaseModel):
 
 
 def _get_session(sid: str):
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 def _plate_rows_cols(unified) -> dict:
@@ -1,5 +1,6 @@
 """Assay preset CRUD API."""
 from __future__ import annotations
+import copy
 import json
 from pathlib import Path
 
@@ -49,8 +50,26 @@ DEFAULT_PRESETS = [
 ]
 
 
+# (file mtime_ns, merged preset list). Every endpoint reloads and re-parses
+# the JSON file; the cache skips that until the file actually changes.
+# Callers receive deep copies because the update endpoint mutates entries.
+_presets_cache: tuple[int, list[dict]] | None = None
+
+
+def _presets_mtime_ns() -> int:
+    try:
+        return PRESETS_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def _load_presets() -> list[dict]:
     """Load presets from JSON file, merging with builtins."""
+    global _presets_cache
+    mtime = _presets_mtime_ns()
+    if _presets_cache is not None and _presets_cache[0] == mtime:
+        return copy.deepcopy(_presets_cache[1])
+
     builtins = [p.copy() for p in DEFAULT_PRESETS]
     if PRESETS_FILE.exists():
         try:
@@ -67,14 +86,18 @@ def _load_presets() -> list[dict]:
         if p.get("id") not in ids:
             result.append(p)
             ids.add(p["id"])
-    return result
+
+    _presets_cache = (mtime, result)
+    return copy.deepcopy(result)
 
 
 def _save_user_presets(presets: list[dict]):
     """Save only user (non-builtin) presets to file."""
+    global _presets_cache
     user_only = [p for p in presets if not p.get("builtin")]
     PRESETS_FILE.parent.mkdir(parents=True, exist_ok=True)
     PRESETS_FILE.write_text(json.dumps(user_only, indent=2))
+    _presets_cache = None
 
 
 class PresetCreate(BaseModel):
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import math
-
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from app.models import UnifiedData
@@ -61,9 +61,10 @@ class MarkerQc(BaseModel):
 
 
 def _get_session(sid: str) -> UnifiedData:
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 def _determine_genotype(
@@ -101,61 +102,64 @@ def _cluster_separation_for(assignments: dict[str, str], points: list) -> float
     distance. Return min inter-cluster distance / max within-cluster spread.
     Returns None if fewer than 2 clusters.
     """
-    # Build per-cluster point lists
-    clusters: dict[str, list[tuple[float, float]]] = {}
+    # Early out before touching the points: the labels seen among the points
+    # are a subset of assignments.values(), so fewer than 2 distinct labels
+    # overall can never yield 2 clusters (one C-level set build vs an O(N)
+    # collection pass that would end in the same None).
+    if len(set(assignments.values())) < 2:
+        return None
+
+    # One pass coding labels to integers and collecting SoA coordinates;
+    # the vectorized core does the rest
+    codes_by_label: dict[str, int] = {}
+    codes: list[int] = []
+    xs: list[float] = []
+    ys: list[float] = []
     for p in points:
         label = assignments.get(p.well)
         if label is None:
             continue
-        if label not in clusters:
-            clusters[label] = []
-        clusters[label].append((p.norm_fam, p.norm_allele2))
+        codes.append(codes_by_label.setdefault(label, len(codes_by_label)))
+        xs.append(p.norm_fam)
+        ys.append(p.norm_allele2)
+
+    return _cluster_separation_np(codes, xs, ys, len(codes_by_label))
 
-    if len(clusters) < 2:
+
+def _cluster_separation_np(
+    codes: list[int], xs: list[float], ys: list[float], k: int
+) -> float | None:
+    """Vectorized cluster-separation core over pre-built SoA arrays.
+
+    ``codes`` holds a 0..k-1 integer label per point. Callers that already
+    walk the points once (``qc_metrics``) collect these arrays during their
+    own pass so no second traversal is needed. Semantics match the loop
+    version: None under 2 clusters, min inter-centroid distance over max
+    within-cluster spread otherwise (bincount centroids, broadcast pairwise
+    centroid distances, one np.hypot reduction for the spread).
+    """
+    if k < 2:
         return None
 
-    # Compute centroids
-    centroids: dict[str, tuple[float, float]] = {}
-    for label, pts in clusters.items():
-        cx = sum(x for x, _ in pts) / len(pts)
-        cy = sum(y for _, y in pts) / len(pts)
-        centroids[label] = (cx, cy)
+    labels = np.fromiter(codes, dtype=np.intp, count=len(codes))
+    x = np.fromiter(xs, dtype=np.float64, count=len(xs))
+    y = np.fromiter(ys, dtype=np.float64, count=len(ys))
+
+    counts = np.bincount(labels, minlength=k)
+    cx = np.bincount(labels, weights=x, minlength=k) / counts
+    cy = np.bincount(labels, weights=y, minlength=k) / counts
 
     # Min inter-cluster distance (between all centroid pairs)
-    labels = list(centroids.keys())
-    min_inter = float("inf")
-    for i in range(len(labels)):
-        for j in range(i + 1, len(labels)):
-            c1 = centroids[labels[i]]
-            c2 = centroids[labels[j]]
-            dist = math.sqrt((c1[0] - c2[0]) ** 2 + (c1[1] - c2[1]) ** 2)
-            if dist < min_inter:
-                min_inter = dist
+    pair_dists = np.hypot(cx[:, None] - cx[None, :], cy[:, None] - cy[None, :])
+    min_inter = float(pair_dists[np.triu_indices(k, 1)].min())
 
     # Max within-cluster spread (max distance from any point to its centroid)
-    max_spread = 0.0
-    for label, pts in clusters.items():
-        cx, cy = centroids[label]
-        for x, y in pts:
-            dist = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-            if dist > max_spread:
-                max_spread = dist
+    max_spread = float(np.hypot(x - cx[labels], y - cy[labels]).max())
 
     if max_spread == 0:
-        return round(min_inter, 6) if min_inter != float("inf") else None
+        return round(min_inter, 6)
 
-    separation = min_inter / max_spread
-    return round(separation, 6)
-
-
-def _compute_cluster_separation(sid: str, points: list) -> float | None:
-    """Compute cluster separation metric.
-
-    Returns None if no clustering or fewer than 2 clusters.
-    """
-    if sid not in cluster_store:
-        return None
-    return _cluster_separation_for(cluster_store[sid].assignments, points)
+    return round(min_inter / max_spread, 6)
 
 
 def _marker_qc(
@@ -226,7 +230,9 @@ async def qc_metrics(
             f"Cycle {cycle} not available. Range: {unified.cycles[0]}-{unified.cycles[-1]}",
         )
 
-    points = normalize_for_cycle(unified, cycle, use_rox=use_rox)
+    # Normalization is the CPU-heavy part on a cache miss; keep it off the
+    # event loop so concurrent requests are not serialized behind it.
+    points = await run_in_threadpool(normalize_for_cycle, unified, cycle, use_rox=use_rox)
 
     cluster_assignments: dict[str, str] = {}
     if sid in cluster_store:
@@ -235,33 +241,41 @@ async def qc_metrics(
 
     # Scale reference: the plate's own median total signal. Every threshold below
     # is a fraction of this, so a low-ROX kit (large magnitudes) works unchanged.
-    signals = sorted(p.norm_fam + p.norm_allele2 for p in points)
+    totals = [p.norm_fam + p.norm_allele2 for p in points]
+    signals = sorted(totals)
     median_signal = signals[len(signals) // 2] if signals else 0.0
     undetermined_min = _UNDETERMINED_FRAC * median_signal
     ntc_hot = _NTC_HOT_FRAC * median_signal
 
-    # --- Call rate ---
+    # --- Fused QC pass ---
+    # Call rate, NTC/control flagging and the cluster-separation inputs all
+    # need the same per-well effective type; one walk over the points does the
+    # dict lookups once per well and feeds all three, instead of three
+    # separate scans (the third hidden inside the separation helper). The
+    # ratio fallback stays ploidy-aware via label_by_ratio rather than a
+    # hardcoded diploid threshold pair.
     n_total = len(points)
     n_called = 0
     ploidy = getattr(unified, "ploidy", 2)
-    for p in points:
-        genotype = _determine_genotype(
-            p.well, p.norm_fam, p.norm_allele2,
-            cluster_assignments, manual_assignments, undetermined_min, ploidy,
-        )
-        if genotype not in ("Undetermined", "NTC"):
-            n_called += 1
-
-    call_rate = n_called / n_total if n_total > 0 else 0.0
-
-    # --- NTC check + control QC warnings ---
     ntc_flagged: list[NtcWell] = []
     ntc_ok = True
     warnings: list[str] = []
 
-    for p in points:
-        effective_type = manual_assignments.get(p.well) or cluster_assignments.get(p.well)
-        signal = p.norm_fam + p.norm_allele2
+    have_clusters = sid in cluster_store
+    sep_codes_by_label: dict[str, int] = {}
+    sep_codes: list[int] = []
+    sep_xs: list[float] = []
+    sep_ys: list[float] = []
+
+    # One merged call map (manual overrides auto, dict union as in the export
+    # router) -> a single lookup resolves each well's effective type; the auto
+    # map is only consulted for the separation arrays when clustering exists
+    effective_map = cluster_assignments | manual_assignments
+    get_effective = effective_map.get
+    get_auto = cluster_assignments.get
+    for p, signal in zip(points, totals):
+        effective_type = get_effective(p.well)
+
         if effective_type == "NTC":
             ntc_flagged.append(NtcWell(well=p.well, signal=round(signal, 6)))
             # Contamination / NTC-overlap: an NTC well as bright as real samples.
@@ -278,10 +292,33 @@ async def qc_metrics(
                     f"Positive control {p.well} shows no amplification — check the run."
                 )
 
+        genotype = effective_type
+        if genotype is None:
+            genotype = (
+                "Undetermined"
+                if signal <= undetermined_min
+                else label_by_ratio(p.norm_fam / signal, ploidy)
+            )
+        if genotype not in ("Undetermined", "NTC"):
+            n_called += 1
+
+        # Separation only looks at auto-clustered wells (same inputs the old
+        # per-call helper rebuilt from cluster_store on its own pass)
+        if have_clusters:
+            auto = get_auto(p.well)
+            if auto is not None:
+                sep_codes.append(sep_codes_by_label.setdefault(auto, len(sep_codes_by_label)))
+                sep_xs.append(p.norm_fam)
+                sep_ys.append(p.norm_allele2)
+
+    call_rate = n_called / n_total if n_total > 0 else 0.0
     ntc_check = NtcCheck(ok=ntc_ok, wells=ntc_flagged)
 
-    # --- Cluster separation ---
-    cluster_separation = _compute_cluster_separation(sid, points)
+    cluster_separation = (
+        _cluster_separation_np(sep_codes, sep_xs, sep_ys, len(sep_codes_by_label))
+        if have_clusters
+        else None
+    )
 
     result = QcResult(
         call_rate=round(call_rate, 4),
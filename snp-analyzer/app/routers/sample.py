@@ -13,23 +13,48 @@ router = APIRouter()
 # session_id -> {well: name}
 sample_name_store: dict[str, dict[str, str]] = {}
 
+# Memoized merge of parsed names + overrides, invalidated by a per-session
+# version counter that every override write bumps. GET /samples is polled by
+# dashboards, and rebuilding a 384-entry dict per poll is pure allocation
+# churn. session_id -> (version, merged dict); the cached dict is shared, so
+# callers must treat it as read-only.
+_merged_cache: dict[str, tuple[int, dict[str, str]]] = {}
+_merged_version: dict[str, int] = {}
+
+
+def _bump_merged_version(sid: str) -> None:
+    _merged_version[sid] = _merged_version.get(sid, 0) + 1
+
 
 class SampleNamesUpdate(BaseModel):
     samples: dict[str, str]
 
 
 def _get_session(sid: str):
-    if sid not in sessions:
+    unified = sessions.get(sid)
+    if unified is None:
         raise HTTPException(404, "Session not found")
-    return sessions[sid]
+    return unified
 
 
 def _merged_samples(sid: str) -> dict[str, str]:
-    """Return merged sample names: parsed names from UnifiedData + user overrides."""
+    """Return merged sample names: parsed names from UnifiedData + user overrides.
+
+    The merge is cached per session and only rebuilt after an override
+    write (PUT/DELETE) bumps the session's version. The returned dict is
+    the shared cache entry — read-only by convention.
+    """
+    version = _merged_version.get(sid, 0)
+    cached = _merged_cache.get(sid)
+    if cached is not None and cached[0] == version:
+        _get_session(sid)  # preserve the 404 on a deleted session
+        return cached[1]
+
     unified = _get_session(sid)
     parsed = dict(unified.sample_names) if unified.sample_names else {}
     overrides = sample_name_store.get(sid, {})
     parsed.update(overrides)
+    _merged_cache[sid] = (version, parsed)
     return parsed
 
 
@@ -53,10 +78,10 @@ async def update_samples(sid: str, body: SampleNamesUpdate, current_user: Curren
     if sid not in sample_name_store:
         sample_name_store[sid] = {}
     sample_name_store[sid].update(body.samples)
+    _bump_merged_version(sid)
 
-    from app.db import save_sample_override
-    for well, name in body.samples.items():
-        save_sample_override(sid, well, name)
+    from app.db import save_sample_overrides_bulk
+    save_sample_overrides_bulk(sid, body.samples)
 
     merged = _merged_samples(sid)
     return {"samples": merged}
@@ -68,6 +93,7 @@ async def delete_samples(sid: str, current_user: CurrentUser):
     _get_session(sid)  # validate session exists
     check_session_access(sid, current_user)
     sample_name_store.pop(sid, None)
+    _bump_merged_version(sid)
 
     from app.db import delete_sample_overrides
     delete_sample_overrides(sid)
@@ -77,28 +103,51 @@ async def delete_samples(sid: str, current_user: CurrentUser):
     return {"samples": parsed}
 
 
+# Session metadata cache for list_sessions: raw_filename/created_at/user_id
+# never change after a session row is created, so they are read from the DB
+# once per session (lazily, which also covers sessions created by the import
+# and example routers) instead of on every listing. Entries are evicted with
+# the session in _delete_sessions_impl. session_id -> row dict; a None value
+# records "not in the DB" so unknown sids don't re-query every call.
+_session_meta: dict[str, dict | None] = {}
+
+
+def invalidate_session_meta(sids: list[str]) -> None:
+    """Drop cached listing metadata for ``sids`` (e.g. after an ownership
+    reassignment changes a session's user_id)."""
+    for sid in sids:
+        _session_meta.pop(sid, None)
+
+
+def _session_meta_for(sids: list[str]) -> dict[str, dict | None]:
+    """Return cached DB metadata for ``sids``, fetching any misses in one query."""
+    missing = [sid for sid in sids if sid not in _session_meta]
+    if missing:
+        from app.db import get_db
+        rows = get_db().execute(
+            f"SELECT session_id, raw_filename, created_at, user_id FROM sessions "
+            f"WHERE session_id IN ({','.join('?' * len(missing))})",
+            missing,
+        ).fetchall()
+        found = {r["session_id"]: dict(r) for r in rows}
+        for sid in missing:
+            _session_meta[sid] = found.get(sid)
+    return {sid: _session_meta[sid] for sid in sids}
+
+
 @router.get("/api/sessions")
 async def list_sessions(current_user: CurrentUser):
     """Return a list of all active sessions with summary info."""
-    # Load raw_filename and created_at from DB for all sessions
-    from app.db import get_db
-    conn = get_db()
-    if current_user.role == "admin" and not is_asg_launch_mode():
-        db_rows = conn.execute(
-            "SELECT session_id, raw_filename, created_at FROM sessions"
-        ).fetchall()
-    else:
-        db_rows = conn.execute(
-            "SELECT session_id, raw_filename, created_at FROM sessions WHERE user_id = ?",
-            (current_user.user_id,),
-        ).fetchall()
-    db_info = {r["session_id"]: dict(r) for r in db_rows}
+    db_info = _session_meta_for(list(sessions.keys()))
+    admin_sees_all = current_user.role == "admin" and not is_asg_launch_mode()
 
     result = []
     for sid, unified in sessions.items():
-        if sid not in db_info:
+        info = db_info.get(sid)
+        if info is None:
+            continue
+        if not admin_sees_all and info.get("user_id") != current_user.user_id:
             continue
-        info = db_info[sid]
         result.append(
             {
                 "session_id": sid,
@@ -129,24 +178,22 @@ def _delete_sessions_impl(sids_to_delete: list[str]):
         cluster_store.pop(sid, None)
         welltype_store.pop(sid, None)
         sample_name_store.pop(sid, None)
+        _merged_cache.pop(sid, None)
+        _merged_version.pop(sid, None)
+        _session_meta.pop(sid, None)
         protocol_store.pop(sid, None)
         group_store.pop(sid, None)
         forget_session_asg_launch(sid)
 
-    # Remove from project_sessions
+    # Remove from DB in one transaction. Per-row executemany reuses a single
+    # prepared statement from the connection's statement cache, where the old
+    # dynamic "IN (?,?,...)" SQL re-prepared a new statement for every batch
+    # size. CASCADE on sessions deletes the remaining child tables.
     conn = get_db()
-    placeholders = ",".join("?" * len(sids_to_delete))
-    conn.execute(
-        f"DELETE FROM project_sessions WHERE session_id IN ({placeholders})",
-        sids_to_delete,
-    )
-
-    # Remove from DB (CASCADE deletes remaining child tables)
-    conn.execute(
-        f"DELETE FROM sessions WHERE session_id IN ({placeholders})",
-        sids_to_delete,
-    )
-    conn.commit()
+    params = [(sid,) for sid in sids_to_delete]
+    with conn:
+        conn.executemany("DELETE FROM project_sessions WHERE session_id = ?", params)
+        conn.executemany("DELETE FROM sessions WHERE session_id = ?", params)
 
 
 # NOTE: bulk-delete MUST be registered before {sid} to avoid path conflict
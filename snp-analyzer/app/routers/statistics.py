@@ -1,4 +1,6 @@
 """Statistics API router -- allele frequency and HWE."""
+from collections import Counter
+
 from fastapi import APIRouter, HTTPException
 
 from app.routers.upload import sessions
@@ -25,9 +27,7 @@ def _marker_stats(region, manual_assignments: dict[str, str]) -> dict:
         freq = allele_frequencies(0, 0, 0)
         hwe = hwe_test(0, 0, 0)
 
-    distribution: dict[str, int] = {}
-    for gt in effective.values():
-        distribution[gt] = distribution.get(gt, 0) + 1
+    distribution = dict(Counter(effective.values()))
 
     return {
         "id": region.id,
@@ -70,10 +70,8 @@ async def get_statistics(sid: str, current_user: CurrentUser):
         freq = allele_frequencies(0, 0, 0)
         hwe = hwe_test(0, 0, 0)
 
-    # Genotype distribution for display
-    distribution = {}
-    for well, gt in effective.items():
-        distribution[gt] = distribution.get(gt, 0) + 1
+    # Genotype distribution for display (Counter runs the tally in C)
+    distribution = dict(Counter(effective.values()))
 
     result = {
         "allele_frequency": freq,
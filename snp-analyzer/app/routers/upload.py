@@ -2,6 +2,7 @@ import os
 import tempfile
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.auth import CurrentUser
 from app.config import (
@@ -75,7 +76,12 @@ async def upload_file(current_user: CurrentUser, file: UploadFile = File(...)):
     tmp_path = ""
     try:
         tmp_path = await _write_upload_to_temp(file, ext)
-        unified = detect_and_parse(tmp_path, original_filename=file.filename or "")
+        # The parser stack (xlrd/openpyxl/zipfile) is synchronous and a multi-MB
+        # workbook takes long enough to stall every other request; run it on a
+        # worker thread so the event loop stays free.
+        unified = await run_in_threadpool(
+            detect_and_parse, tmp_path, original_filename=file.filename or ""
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -32,19 +32,10 @@ async def list_users(admin: AdminUser):
     rows = conn.execute(
         "SELECT id, username, display_name, role, is_active, created_at FROM users ORDER BY created_at"
     ).fetchall()
-    return {
-        "users": [
-            {
-                "id": r["id"],
-                "username": r["username"],
-                "display_name": r["display_name"],
-                "role": r["role"],
-                "is_active": bool(r["is_active"]),
-                "created_at": r["created_at"],
-            }
-            for r in rows
-        ]
-    }
+    # sqlite3.Row supports the mapping protocol, so dict(r) builds each entry
+    # at C level from the selected columns; only is_active needs the int ->
+    # bool coercion on top.
+    return {"users": [dict(r, is_active=bool(r["is_active"])) for r in rows]}
 
 
 @admin_router.get("/dashboard")
@@ -215,17 +206,32 @@ async def delete_user(user_id: str, admin: AdminUser):
 
     conn = get_db()
 
-    # Reassign sessions and projects to admin
-    conn.execute(
-        "UPDATE sessions SET user_id = ? WHERE user_id = ?",
-        (admin.user_id, user_id),
-    )
-    conn.execute(
-        "UPDATE projects SET user_id = ? WHERE user_id = ?",
-        (admin.user_id, user_id),
-    )
-
-    conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
-    conn.commit()
+    # Reassign sessions and projects to admin, then drop the user — one
+    # BEGIN/COMMIT via the with-block instead of autocommit per statement.
+    # The session SELECT both skips a no-op UPDATE for users who own nothing
+    # and feeds the listing-cache invalidation below.
+    with conn:
+        moved = [
+            r["session_id"]
+            for r in conn.execute(
+                "SELECT session_id FROM sessions WHERE user_id = ?", (user_id,)
+            ).fetchall()
+        ]
+        if moved:
+            conn.execute(
+                "UPDATE sessions SET user_id = ? WHERE user_id = ?",
+                (admin.user_id, user_id),
+            )
+        conn.execute(
+            "UPDATE projects SET user_id = ? WHERE user_id = ?",
+            (admin.user_id, user_id),
+        )
+        conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+
+    if moved:
+        # The session listing caches user_id per session; the reassignment
+        # above just changed it.
+        from app.routers.sample import invalidate_session_meta
+        invalidate_session_meta(moved)
 
     return {"status": "ok"}